@@ -15,6 +15,7 @@ export interface OrganizationMediaUploadResponse {
 export interface OrganizationMediaDeleteRequest {
   media_url?: string;
   object_key?: string;
+  media_urls?: string[];
 }
 
 function buildOrganizationMediaUrl(organizationId: string) {
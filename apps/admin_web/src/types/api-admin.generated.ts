@@ -4333,6 +4333,8 @@ export interface components {
             object_key?: string;
             /** @description Media URL to delete (alternative to object_key) */
             media_url?: string;
+            /** @description Media URLs to delete in one request (alternative to media_url) */
+            media_urls?: string[];
         };
         FeedbackLabel: {
             /** Format: uuid */
@@ -0,0 +1,60 @@
+"""Add sequences for progressive ticket IDs.
+
+Ticket IDs were allocated with MAX(ticket_id) + 1, which aggregates over
+the tickets table on every submission and hands out duplicate IDs to
+concurrent submissions. Each ticket prefix now gets its own sequence,
+seeded past the highest existing number.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+from typing import Union
+
+from alembic import op
+
+revision: str = "0029_ticket_id_sequences"
+down_revision: Union[str, None] = "0028_hk_regions_wizard"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TICKET_ID_SEQUENCES = {
+    "R": "ticket_id_access_request_seq",
+    "S": "ticket_id_suggestion_seq",
+    "F": "ticket_id_feedback_seq",
+}
+
+# Both runtime roles insert tickets, so both allocate IDs with nextval().
+TICKET_ID_SEQUENCE_ROLES = ("siutindei_app", "siutindei_admin")
+
+
+def upgrade() -> None:
+    """Create and seed one sequence per ticket ID prefix."""
+    for prefix, sequence_name in TICKET_ID_SEQUENCES.items():
+        op.execute(f"CREATE SEQUENCE IF NOT EXISTS {sequence_name} START 1")
+        op.execute(
+            f"""
+            SELECT setval(
+              '{sequence_name}',
+              COALESCE(
+                (
+                  SELECT MAX(CAST(SUBSTRING(ticket_id FROM 2) AS BIGINT))
+                  FROM tickets
+                  WHERE ticket_id LIKE '{prefix}%'
+                ),
+                0
+              ) + 1,
+              false
+            )
+            """
+        )
+        for role in TICKET_ID_SEQUENCE_ROLES:
+            op.execute(f"GRANT USAGE, SELECT ON SEQUENCE {sequence_name} TO {role};")
+
+
+def downgrade() -> None:
+    """Drop ticket ID sequences."""
+    for sequence_name in TICKET_ID_SEQUENCES.values():
+        for role in TICKET_ID_SEQUENCE_ROLES:
+            op.execute(f"REVOKE USAGE, SELECT ON SEQUENCE {sequence_name} FROM {role};")
+        op.execute(f"DROP SEQUENCE IF EXISTS {sequence_name}")
@@ -0,0 +1,40 @@
+"""Add keyset pagination indexes for ticket listings.
+
+Admin ticket listings page newest first on (created_at, id), optionally
+filtered by status.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0030_ticket_keyset_idx"
+down_revision: Union[str, None] = "0029_ticket_id_sequences"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create (created_at, id) keyset indexes on tickets."""
+    op.create_index(
+        "tickets_created_at_id_idx",
+        "tickets",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "tickets_status_created_at_id_idx",
+        "tickets",
+        ["status", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.drop_index("tickets_created_at_idx", table_name="tickets")
+
+
+def downgrade() -> None:
+    """Restore the single-column created_at index."""
+    op.create_index("tickets_created_at_idx", "tickets", ["created_at"])
+    op.drop_index("tickets_status_created_at_id_idx", table_name="tickets")
+    op.drop_index("tickets_created_at_id_idx", table_name="tickets")
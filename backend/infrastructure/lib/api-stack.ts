@@ -1206,6 +1206,7 @@ export class ApiStack extends cdk.Stack {
       "cognito-idp:admin_add_user_to_group",
       "cognito-idp:admin_remove_user_from_group",
       "cognito-idp:admin_list_groups_for_user",
+      "cognito-idp:list_users_in_group",
       "cognito-idp:admin_user_global_sign_out",
       "cognito-idp:admin_update_user_attributes",
     ];
@@ -1236,6 +1237,7 @@ export class ApiStack extends cdk.Stack {
           "cognito-idp:AdminAddUserToGroup",
           "cognito-idp:AdminRemoveUserFromGroup",
           "cognito-idp:AdminListGroupsForUser",
+          "cognito-idp:ListUsersInGroup",
           "cognito-idp:AdminUserGlobalSignOut",
           "cognito-idp:AdminUpdateUserAttributes",
         ],
@@ -1291,7 +1293,7 @@ export class ApiStack extends cdk.Stack {
     // SECURITY: Use customer-managed KMS key (Checkov CKV_AWS_27)
     const managerRequestQueue = new sqs.Queue(this, "ManagerRequestQueue", {
       queueName: name("manager-request-queue"),
-      visibilityTimeout: cdk.Duration.seconds(60), // 6x Lambda timeout
+      visibilityTimeout: cdk.Duration.seconds(180), // 6x Lambda timeout
       deadLetterQueue: {
         queue: managerRequestDLQ,
         maxReceiveCount: 3, // Retry 3 times before DLQ
@@ -1324,7 +1326,8 @@ export class ApiStack extends cdk.Stack {
       "ManagerRequestProcessor",
       {
         handler: "lambda/manager_request_processor/handler.lambda_handler",
-        timeout: cdk.Duration.seconds(10),
+        // Sized for a full batch of 10 messages
+        timeout: cdk.Duration.seconds(30),
         environment: {
           DATABASE_SECRET_ARN: database.adminUserSecret.secretArn,
           DATABASE_NAME: "siutindei",
@@ -1341,18 +1344,35 @@ export class ApiStack extends cdk.Stack {
     database.grantAdminUserSecretRead(managerRequestProcessor);
     database.grantConnect(managerRequestProcessor, "siutindei_admin");
 
-    // Grant SES permissions to processor
+    // Grant SES permissions to processor (templated sends cover the
+    // optional SES_TEMPLATE_* templates, which are not set by this stack)
     managerRequestProcessor.addToRolePolicy(
       new iam.PolicyStatement({
-        actions: ["ses:SendEmail", "ses:SendRawEmail"],
-        resources: [sesSenderIdentityArn],
+        actions: [
+          "ses:SendEmail",
+          "ses:SendRawEmail",
+          "ses:SendTemplatedEmail",
+          "ses:SendBulkTemplatedEmail",
+        ],
+        resources: [
+          sesSenderIdentityArn,
+          cdk.Stack.of(this).formatArn({
+            service: "ses",
+            resource: "template",
+            resourceName: "*",
+          }),
+        ],
       })
     );
 
-    // Connect SQS to Lambda (triggers Lambda on new messages)
+    // Connect SQS to Lambda (triggers Lambda on new messages). The handler
+    // returns batchItemFailures, so only failed messages are retried and a
+    // poison message cannot send the rest of its batch to the DLQ.
     managerRequestProcessor.addEventSource(
       new lambdaEventSources.SqsEventSource(managerRequestQueue, {
-        batchSize: 1, // Process one at a time for simplicity
+        batchSize: 10,
+        maxBatchingWindow: cdk.Duration.seconds(5),
+        reportBatchItemFailures: true,
       })
     );
 
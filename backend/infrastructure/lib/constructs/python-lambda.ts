@@ -94,6 +94,10 @@ export class PythonLambda extends Construct {
         (extraPath) => `cp -au "${extraPath}" "/asset-output/${extraPath}"`
       ),
       ...cleanupCommands,
+      // Ship deterministic bytecode for first-party code; the Lambda
+      // filesystem is read-only so it cannot be cached at runtime.
+      "python -m compileall -q --invalidation-mode unchecked-hash " +
+        "/asset-output/lambda /asset-output/src",
     ];
 
     function normalizeExtraCopyPaths(
@@ -33,7 +33,7 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     code = challenge["code"]
 
     # SECURITY: Mask email in logs to protect PII
-    logger.info(f"Creating auth challenge for {mask_email(email)}")
+    logger.info("Creating auth challenge for %s", mask_email(email))
 
     if email:
         try:
@@ -42,7 +42,7 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             logger.info("Challenge email sent successfully")
         except Exception as exc:
             # SECURITY: Log error type but not full details which may contain PII
-            logger.error(f"Failed to send challenge email: {type(exc).__name__}")
+            logger.error("Failed to send challenge email: %s", type(exc).__name__)
             raise
 
     response["publicChallengeParameters"] = {"email": email}
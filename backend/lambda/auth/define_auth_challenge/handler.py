@@ -26,7 +26,8 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     masked_username = mask_email(str(username))
 
     logger.debug(
-        f"Define auth challenge for {masked_username}",
+        "Define auth challenge for %s",
+        masked_username,
         extra={"session_length": len(session), "max_attempts": max_attempts},
     )
 
@@ -35,18 +36,18 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         if last.get("challengeName") == "CUSTOM_CHALLENGE" and last.get(
             "challengeResult"
         ):
-            logger.info(f"Auth successful for {masked_username}")
+            logger.info("Auth successful for %s", masked_username)
             response["issueTokens"] = True
             response["failAuthentication"] = False
             return event
 
         if len(session) >= max_attempts:
-            logger.warning(f"Max auth attempts reached for {masked_username}")
+            logger.warning("Max auth attempts reached for %s", masked_username)
             response["issueTokens"] = False
             response["failAuthentication"] = True
             return event
 
-    logger.debug(f"Issuing custom challenge for {masked_username}")
+    logger.debug("Issuing custom challenge for %s", masked_username)
     response["issueTokens"] = False
     response["failAuthentication"] = False
     response["challengeName"] = "CUSTOM_CHALLENGE"
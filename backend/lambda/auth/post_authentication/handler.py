@@ -55,7 +55,7 @@ def lambda_handler(event: Mapping[str, Any], _context: Any) -> Mapping[str, Any]
                 }
             ],
         )
-        logger.info(f"Updated last login time for {masked_user}")
+        logger.info("Updated last login time for %s", masked_user)
     except Exception as exc:
         logger.warning(
             "Failed to update last login time",
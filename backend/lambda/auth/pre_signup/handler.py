@@ -22,7 +22,7 @@ def lambda_handler(event, _context):
     email = user_attributes.get("email", "")
 
     # SECURITY: Mask email in logs to protect PII
-    logger.info(f"Pre-signup for {mask_email(email)}")
+    logger.info("Pre-signup for %s", mask_email(email))
 
     # Auto-confirm the user (we verify via custom auth challenge)
     response["autoConfirmUser"] = True
@@ -31,8 +31,8 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     # SECURITY: Mask email in logs to protect PII
     masked_email = mask_email(email)
     if is_correct:
-        logger.info(f"Challenge verified successfully for {masked_email}")
+        logger.info("Challenge verified successfully for %s", masked_email)
     else:
-        logger.warning(f"Challenge verification failed for {masked_email}")
+        logger.warning("Challenge verification failed for %s", masked_email)
 
     return event
@@ -75,8 +75,9 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
 
         if matching_groups:
             logger.info(
-                f"Access granted for user {user_sub[:8]}*** "
-                f"(groups: {', '.join(matching_groups)})"
+                "Access granted for user %s*** (groups: %s)",
+                user_sub[:8],
+                ", ".join(matching_groups),
             )
             return policy(
                 "Allow",
@@ -91,8 +92,10 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             )
         else:
             logger.warning(
-                f"Access denied for user {user_sub[:8]}*** "
-                f"(user groups: {user_groups}, required: {allowed_groups})"
+                "Access denied for user %s*** (user groups: %s, required: %s)",
+                user_sub[:8],
+                user_groups,
+                allowed_groups,
             )
             return policy(
                 "Deny",
@@ -102,9 +105,11 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             )
 
     except JWTValidationError as exc:
-        logger.warning(f"JWT validation failed: {exc.message} (reason: {exc.reason})")
+        logger.warning(
+            "JWT validation failed: %s (reason: %s)", exc.message, exc.reason
+        )
         return policy("Deny", method_arn, "invalid", {"reason": exc.reason})
     except Exception as exc:
         # SECURITY: Don't expose internal error details
-        logger.warning(f"Token validation failed: {type(exc).__name__}")
+        logger.warning("Token validation failed: %s", type(exc).__name__)
         return policy("Deny", method_arn, "invalid", {"reason": "invalid_token"})
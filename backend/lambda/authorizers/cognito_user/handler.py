@@ -61,8 +61,9 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         user_groups = claims.groups
 
         logger.info(
-            f"Access granted for authenticated user {user_sub[:8]}*** "
-            f"(groups: {', '.join(user_groups) if user_groups else 'none'})"
+            "Access granted for authenticated user %s*** (groups: %s)",
+            user_sub[:8],
+            ", ".join(user_groups) if user_groups else "none",
         )
 
         return policy(
@@ -77,9 +78,11 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         )
 
     except JWTValidationError as exc:
-        logger.warning(f"JWT validation failed: {exc.message} (reason: {exc.reason})")
+        logger.warning(
+            "JWT validation failed: %s (reason: %s)", exc.message, exc.reason
+        )
         return policy("Deny", method_arn, "invalid", {"reason": exc.reason})
     except Exception as exc:
         # SECURITY: Don't expose internal error details
-        logger.warning(f"Token validation failed: {type(exc).__name__}")
+        logger.warning("Token validation failed: %s", type(exc).__name__)
         return policy("Deny", method_arn, "invalid", {"reason": "invalid_token"})
@@ -96,7 +96,7 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             )
 
         principal = decoded.get("sub", "device")
-        logger.info(f"Device attestation verified for principal: {principal[:8]}***")
+        logger.info("Device attestation verified for principal: %s***", principal[:8])
         return policy(
             "Allow",
             method_arn,
@@ -107,7 +107,7 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
 
     except Exception as exc:
         # SECURITY: Don't expose detailed error messages to clients
-        logger.warning(f"Device attestation failed: {type(exc).__name__}")
+        logger.warning("Device attestation failed: %s", type(exc).__name__)
         return policy(
             "Deny",
             method_arn,
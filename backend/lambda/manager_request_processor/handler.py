@@ -6,8 +6,15 @@ It processes submissions asynchronously:
 2. Stores the ticket in the database (with idempotency check)
 3. Sends email notification to support/admin
 
+Ticket decision events (``ticket.decided``) published by the admin API are
+handled on the same queue: the reviewed tickets in a batch are loaded and
+their decision emails are sent together once the batch has been read.
+
+Failed records are reported back through ``batchItemFailures`` so only
+those messages are retried; the rest of the batch is deleted.
+
 The decoupled architecture provides:
-- Automatic retries (3 attempts before DLQ)
+- Automatic retries (3 attempts per message before DLQ)
 - Fault tolerance (email failures don't block DB writes)
 - Scalability (can process multiple submissions concurrently)
 """
@@ -22,6 +29,10 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.api.admin_ticket_notifications import (
+    TICKET_DECISION_EVENT_TYPE,
+    _send_ticket_decision_emails,
+)
 from app.db.engine import get_engine
 from app.db.models import Ticket, TicketType
 from app.db.repositories import FeedbackLabelRepository, TicketRepository
@@ -59,13 +70,14 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         context: Lambda context object.
 
     Returns:
-        Response with processing statistics.
-
-    Raises:
-        Exception: If processing fails (triggers SQS retry).
+        Response with processing statistics and the ``batchItemFailures``
+        SQS retries (the event source reports batch item failures).
     """
     processed = 0
     skipped = 0
+    failed_ids: list[str] = []
+    decisions: list[dict[str, Any]] = []
+    decision_ids: list[str] = []
 
     for record in event.get("Records", []):
         try:
@@ -77,9 +89,14 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             message = json.loads(message_str)
 
             event_type = message.get("event_type")
+            if event_type == TICKET_DECISION_EVENT_TYPE:
+                decisions.append(message)
+                decision_ids.append(record["messageId"])
+                continue
+
             ticket_type = EVENT_TYPE_MAP.get(event_type)
             if ticket_type is None:
-                logger.info(f"Skipping unsupported event type: {event_type}")
+                logger.info("Skipping unsupported event type: %s", event_type)
                 skipped += 1
                 continue
 
@@ -89,13 +106,13 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 skipped += 1
                 continue
 
-            logger.info(f"Processing {event_type}: {ticket_id}")
+            logger.info("Processing %s: %s", event_type, ticket_id)
 
             # Store in database with idempotency check
             ticket = _store_ticket(message, ticket_type)
 
             if ticket is None:
-                logger.info(f"Ticket {ticket_id} already exists, skipping")
+                logger.info("Ticket %s already exists, skipping", ticket_id)
                 skipped += 1
                 continue
 
@@ -103,16 +120,26 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             _send_notification_email(ticket)
 
             processed += 1
-            logger.info(f"Successfully processed {event_type}: {ticket_id}")
+            logger.info("Successfully processed %s: %s", event_type, ticket_id)
 
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse message JSON: {e}")
-            # Re-raise to trigger retry
-            raise
+            logger.error("Failed to parse message JSON: %s", e)
+            # Report the record so SQS retries it / moves it to the DLQ
+            failed_ids.append(record["messageId"])
         except Exception as e:
-            logger.exception(f"Failed to process record: {e}")
-            # Re-raise to trigger SQS retry / DLQ
-            raise
+            logger.exception("Failed to process record: %s", e)
+            # Report the record so SQS retries it / moves it to the DLQ
+            failed_ids.append(record["messageId"])
+
+    if decisions:
+        try:
+            sent = _send_decision_notifications(decisions)
+        except Exception as e:
+            logger.exception("Failed to send ticket decision emails: %s", e)
+            failed_ids.extend(decision_ids)
+        else:
+            processed += sent
+            skipped += len(decisions) - sent
 
     result = {
         "statusCode": 200,
@@ -120,13 +147,58 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             {
                 "processed": processed,
                 "skipped": skipped,
+                "failed": len(failed_ids),
             }
         ),
+        "batchItemFailures": [
+            {"itemIdentifier": message_id} for message_id in failed_ids
+        ],
     }
-    logger.info(f"Processing complete: {result}")
+    logger.info("Processing complete: %s", result)
     return result
 
 
+def _send_decision_notifications(messages: list[dict[str, Any]]) -> int:
+    """Send decision emails for the reviewed tickets in a batch.
+
+    Args:
+        messages: Parsed SNS messages with ticket_id, action, and admin_notes.
+
+    Returns:
+        Number of decisions whose email was dispatched.
+    """
+    requested: dict[str, dict[str, Any]] = {}
+    for message in messages:
+        ticket_id = message.get("ticket_id")
+        if not ticket_id or message.get("action") not in ("approve", "reject"):
+            logger.warning("Ticket decision message missing ticket_id or action")
+            continue
+        requested[ticket_id] = message
+
+    if not requested:
+        return 0
+
+    with Session(get_engine()) as session:
+        tickets = TicketRepository(session).find_by_ticket_ids(list(requested))
+        found = {ticket.ticket_id: ticket for ticket in tickets}
+        for ticket_id in requested.keys() - found.keys():
+            logger.warning("Ticket %s not found, skipping decision email", ticket_id)
+
+        _send_ticket_decision_emails(
+            [
+                (
+                    ticket,
+                    requested[ticket_id]["action"],
+                    requested[ticket_id].get("admin_notes") or "",
+                )
+                for ticket_id, ticket in found.items()
+            ]
+        )
+
+    logger.info("Processed %s ticket decision(s)", len(found))
+    return len(found)
+
+
 def _store_ticket(
     message: dict[str, Any],
     ticket_type: TicketType,
@@ -194,7 +266,7 @@ def _store_ticket(
         session.refresh(ticket)
 
         logger.info(
-            f"Stored ticket in database: {ticket_id} (type={ticket_type.value})"
+            "Stored ticket in database: %s (type=%s)", ticket_id, ticket_type.value
         )
         return ticket
 
@@ -301,11 +373,13 @@ def _send_notification_email(ticket: Ticket) -> None:
                 body_text=email_content.body_text,
                 body_html=email_content.body_html,
             )
-        logger.info(f"Notification email sent for {ticket.ticket_id}")
+        logger.info("Notification email sent for %s", ticket.ticket_id)
 
     except Exception as e:
         # Log but don't re-raise - DB write succeeded, email is secondary
-        logger.error(f"Failed to send notification email for {ticket.ticket_id}: {e}")
+        logger.error(
+            "Failed to send notification email for %s: %s", ticket.ticket_id, e
+        )
 
 
 def _resolve_feedback_labels(label_ids: list[Any]) -> list[str]:
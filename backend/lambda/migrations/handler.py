@@ -102,7 +102,7 @@ def _handle_seed_only(event: Mapping[str, Any], context: Any) -> dict[str, Any]:
             logger.info("No seed_manager_sub provided, attempting to create user")
             seed_manager_sub = _get_or_create_seed_manager()
         else:
-            logger.info(f"Using provided seed_manager_sub: {seed_manager_sub}")
+            logger.info("Using provided seed_manager_sub: %s", seed_manager_sub)
 
         _run_with_retry(_run_seed, database_url, seed_path, seed_manager_sub)
 
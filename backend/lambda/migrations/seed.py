@@ -70,10 +70,10 @@ def _get_or_create_seed_manager() -> str:
             }
             sub = attributes.get("sub")
             if sub:
-                logger.info(f"Found existing seed manager user: {masked_seed_email}")
+                logger.info("Found existing seed manager user: %s", masked_seed_email)
                 return str(sub)
     except AwsProxyError as exc:
-        logger.warning(f"Error checking for existing user: {exc}")
+        logger.warning("Error checking for existing user: %s", exc)
 
     try:
         response = _cognito(
@@ -117,7 +117,9 @@ def _get_or_create_seed_manager() -> str:
         if not sub:
             raise RuntimeError("Created user does not have a sub attribute")
 
-        logger.info(f"Created seed manager user: {masked_seed_email} with sub: {sub}")
+        logger.info(
+            "Created seed manager user: %s with sub: %s", masked_seed_email, sub
+        )
         return str(sub)
 
     except AwsProxyError as exc:
@@ -22,14 +22,17 @@ def _run_with_retry(func: Any, *args: Any) -> None:
     for attempt in range(max_attempts):
         try:
             func(*args)
-            logger.info(f"Operation {func_name} completed successfully")
+            logger.info("Operation %s completed successfully", func_name)
             return
         except Exception as exc:  # pragma: no cover - best effort retry
             error_type = type(exc).__name__
             error_msg = str(exc)
             safe_msg = _sanitize_error_message(error_msg)
             logger.warning(
-                f"Attempt {attempt + 1}/{max_attempts} for {func_name} failed",
+                "Attempt %s/%s for %s failed",
+                attempt + 1,
+                max_attempts,
+                func_name,
                 extra={
                     "attempt": attempt + 1,
                     "max_attempts": max_attempts,
@@ -40,7 +43,7 @@ def _run_with_retry(func: Any, *args: Any) -> None:
             )
             last_error = exc
             if attempt < max_attempts - 1:
-                logger.info(f"Retrying {func_name} in {delay:.1f} seconds...")
+                logger.info("Retrying %s in %.1f seconds...", func_name, delay)
                 time.sleep(delay)
                 delay = min(delay * 1.5, 30.0)
     if last_error:
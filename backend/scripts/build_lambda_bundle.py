@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import argparse
+import compileall
 import hashlib
 import logging
 import os
 from pathlib import Path
+import py_compile
 import shutil
 import subprocess
 import sys
@@ -20,6 +22,7 @@ TARGET_PYTHON_VERSION = "3.12"
 CACHE_FORMAT_VERSION = "1"
 DEFAULT_CACHE_RETENTION = 3
 CACHE_RETENTION_ENV_VAR = "LAMBDA_DEPS_CACHE_RETENTION"
+PRECOMPILED_SOURCE_DIRS = ("lambda", "src")
 
 
 def _ensure_python_version() -> None:
@@ -51,6 +54,21 @@ def _cleanup_bundle(output_dir: Path) -> None:
         cache_file.unlink()
 
 
+def _precompile_sources(output_dir: Path) -> None:
+    # The Lambda filesystem is read-only, so bytecode for first-party code
+    # would otherwise be recompiled on every cold start. Unchecked-hash pycs
+    # are deterministic and never revalidated against the shipped sources.
+    for source_dir in PRECOMPILED_SOURCE_DIRS:
+        compiled = compileall.compile_dir(
+            output_dir / source_dir,
+            quiet=1,
+            optimize=0,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        )
+        if not compiled:
+            raise SystemExit(f"Failed to precompile Lambda sources in {source_dir}")
+
+
 def _parse_cache_retention_value(value: str) -> int:
     stripped = value.strip()
     if not stripped:
@@ -264,6 +282,7 @@ def build_bundle(
     _copy_tree(source_root / "lambda", output_dir / "lambda")
     _copy_tree(source_root / "src", output_dir / "src")
     _cleanup_bundle(output_dir)
+    _precompile_sources(output_dir)
 
 
 def _parse_args() -> argparse.Namespace:
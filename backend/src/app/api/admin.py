@@ -6,7 +6,8 @@ for cleaner separation of concerns and better testability.
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional
+import logging
+from typing import Any, Final, Mapping, Optional
 
 from app.api.admin_address_search import _handle_address_search
 from app.api.admin_areas import (
@@ -72,7 +73,7 @@ from app.api.admin_validators import (
     _validate_url,
 )
 from app.api.user_organizations import _handle_user_organizations
-from app.exceptions import NotFoundError, ValidationError
+from app.exceptions import AuthorizationError, NotFoundError, ValidationError
 from app.utils import json_response
 from app.utils.logging import configure_logging, get_logger, set_request_context
 from app.utils.responses import validate_content_type
@@ -80,6 +81,16 @@ from app.utils.responses import validate_content_type
 configure_logging()
 logger = get_logger(__name__)
 
+_MANAGER_RESOURCES: Final[frozenset[str]] = frozenset(
+    {
+        "organizations",
+        "locations",
+        "activities",
+        "pricing",
+        "schedules",
+    }
+)
+
 __all__ = [
     "lambda_handler",
     "MAX_DESCRIPTION_LENGTH",
@@ -122,17 +133,20 @@ def lambda_handler(event: Mapping[str, Any], context: Any) -> dict[str, Any]:
     try:
         validate_content_type(event)
     except ValidationError as exc:
-        logger.warning(f"Content-Type validation failed: {exc.message}")
+        logger.warning("Content-Type validation failed: %s", exc.message)
         return json_response(exc.status_code, exc.to_dict(), event=event)
 
-    logger.info(
-        f"Admin request: {method} {path}",
-        extra={
-            "base_path": base_path,
-            "resource": resource,
-            "resource_id": resource_id,
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Admin request: %s %s",
+            method,
+            path,
+            extra={
+                "base_path": base_path,
+                "resource": resource,
+                "resource_id": resource_id,
+            },
+        )
 
     if base_path == "user":
         return _handle_user_routes(event, method, resource, resource_id)
@@ -208,15 +222,17 @@ def _safe_handler(
     try:
         return handler()
     except ValidationError as exc:
-        logger.warning(f"Validation error: {exc.message}")
+        logger.warning("Validation error: %s", exc.message)
         return json_response(exc.status_code, exc.to_dict(), event=event)
     except NotFoundError as exc:
         return json_response(exc.status_code, exc.to_dict(), event=event)
+    except AuthorizationError as exc:
+        return json_response(exc.status_code, exc.to_dict(), event=event)
     except ValueError as exc:
-        logger.warning(f"Value error: {exc}")
+        logger.warning("Value error: %s", exc)
         return json_response(400, {"error": str(exc)}, event=event)
     except Exception as exc:  # pragma: no cover
-        logger.exception(f"Unexpected error in handler: {type(exc).__name__}")
+        logger.exception("Unexpected error in handler: %s", type(exc).__name__)
         return json_response(500, {"error": "Internal server error"}, event=event)
 
 
@@ -283,14 +299,7 @@ def _handle_manager_routes(
         logger.warning("Unauthorized manager access attempt")
         return json_response(403, {"error": "Forbidden"}, event=event)
 
-    manager_resources = {
-        "organizations",
-        "locations",
-        "activities",
-        "pricing",
-        "schedules",
-    }
-    if resource not in manager_resources:
+    if resource not in _MANAGER_RESOURCES:
         return json_response(404, {"error": "Not found"}, event=event)
 
     managed_org_ids = _get_managed_organization_ids(event)
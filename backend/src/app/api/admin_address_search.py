@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import os
 from typing import Any, Mapping
 from urllib.parse import urlencode
 
+import orjson
+
 from app.api.admin_request import _query_param
 from app.api.admin_validators import MAX_ADDRESS_LENGTH
 from app.exceptions import ValidationError
@@ -81,8 +82,8 @@ def _handle_address_search(event: Mapping[str, Any]) -> dict[str, Any]:
         )
 
     try:
-        payload = json.loads(body)
-    except json.JSONDecodeError:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
         logger.warning("Address search returned invalid JSON")
         return json_response(
             502,
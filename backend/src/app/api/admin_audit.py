@@ -52,7 +52,7 @@ def _handle_audit_logs(
 ) -> dict[str, Any]:
     """Handle audit log queries."""
     if audit_id:
-        logger.info(f"Fetching audit log entry: {audit_id}")
+        logger.info("Fetching audit log entry: %s", audit_id)
         return _get_audit_log_by_id(event, audit_id)
 
     logger.info("Listing audit logs with filters")
@@ -158,10 +158,9 @@ def _list_audit_logs(event: Mapping[str, Any]) -> dict[str, Any]:
         trimmed = list(rows)[:limit]
 
         logger.info(
-            (
-                "Audit logs query returned "
-                f"{len(trimmed)} entries (has_more={has_more})"
-            ),
+            "Audit logs query returned %s entries (has_more=%s)",
+            len(trimmed),
+            has_more,
             extra={
                 "table": table_name,
                 "action": action,
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import os
 from typing import Any, Mapping, Optional
 
 from sqlalchemy.orm import Session
 
+from app.api.admin_request import _env_group
 from app.db.audit import set_audit_context
 from app.db.engine import get_engine
 from app.db.repositories import OrganizationRepository
@@ -42,7 +42,7 @@ def _is_admin(event: Mapping[str, Any]) -> bool:
     """Return True when request belongs to an admin user."""
     ctx = _get_authorizer_context(event)
     groups = ctx.get("groups", "")
-    admin_group = os.getenv("ADMIN_GROUP", "admin")
+    admin_group = _env_group("ADMIN_GROUP", "admin")
     return admin_group in groups.split(",") if groups else False
 
 
@@ -50,7 +50,7 @@ def _is_manager(event: Mapping[str, Any]) -> bool:
     """Return True when request belongs to a manager user."""
     ctx = _get_authorizer_context(event)
     groups = ctx.get("groups", "")
-    manager_group = os.getenv("MANAGER_GROUP", "manager")
+    manager_group = _env_group("MANAGER_GROUP", "manager")
     return manager_group in groups.split(",") if groups else False
 
 
@@ -91,9 +91,8 @@ def _get_managed_organization_ids(event: Mapping[str, Any]) -> set[str]:
     if not user_sub:
         return set()
 
+    # Read-only id lookup: no audit context is needed since nothing is
+    # written, and unlike find_by_manager it is not capped at a page size.
     with Session(get_engine()) as session:
-        # Read-only query, but set context for consistency
-        _set_session_audit_context(session, event)
         repo = OrganizationRepository(session)
-        orgs = repo.find_by_manager(user_sub)
-        return {str(org.id) for org in orgs}
+        return {str(org_id) for org_id in repo.find_ids_by_manager(user_sub)}
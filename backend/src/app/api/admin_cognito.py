@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import os
+import contextvars
 import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Final, Mapping, Optional
 
 from sqlalchemy.orm import Session
 
 from app.api.admin_auth import _get_user_sub, _set_session_audit_context
 from app.api.admin_request import (
+    _env_group,
     _parse_group_name,
     _query_param,
     _require_env,
@@ -30,7 +33,24 @@ USER_SUB_PATTERN = re.compile(
     r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
 )
 MAX_COGNITO_LIST_LIMIT = 60
-MAX_ORG_TRANSFER_LIMIT = 1000
+
+# Per-container cache for the manager approval path. A sub never changes
+# username; group membership is never cached for approvals since other
+# containers and tools can change it.
+COGNITO_USER_CACHE_TTL_SECONDS: Final[float] = 300.0
+COGNITO_USER_CACHE_MAX_ENTRIES: Final[int] = 1024
+_SUB_TO_USERNAME: dict[str, tuple[float, str]] = {}
+
+# Short-lived per-container cache of admin/manager memberships, keyed by
+# user pool ID. Only used to display groups in user listings.
+GROUP_MEMBERSHIP_CACHE_TTL_SECONDS: Final[float] = 60.0
+_GROUP_MEMBERSHIPS: dict[str, tuple[float, dict[str, list[str]]]] = {}
+
+# Bounded pool for the per-user admin_get_user calls made while listing users.
+COGNITO_LOOKUP_WORKERS: Final[int] = 8
+_COGNITO_EXECUTOR = ThreadPoolExecutor(
+    max_workers=COGNITO_LOOKUP_WORKERS, thread_name_prefix="cognito-lookup"
+)
 
 
 def _mask_cognito_username(username: str) -> str:
@@ -65,8 +85,9 @@ def _handle_user_group(
             Username=username,
             GroupName=group_name,
         )
+        _forget_group_memberships()
         _invalidate_user_session(user_pool_id, username)
-        logger.info(f"Added user {masked_username} to group {group_name}")
+        logger.info("Added user %s to group %s", masked_username, group_name)
         return json_response(200, {"status": "added", "group": group_name}, event=event)
 
     if method == "DELETE":
@@ -77,8 +98,9 @@ def _handle_user_group(
             Username=username,
             GroupName=group_name,
         )
+        _forget_group_memberships()
         _invalidate_user_session(user_pool_id, username)
-        logger.info(f"Removed user {masked_username} from group {group_name}")
+        logger.info("Removed user %s from group %s", masked_username, group_name)
         return json_response(
             200, {"status": "removed", "group": group_name}, event=event
         )
@@ -95,11 +117,13 @@ def _invalidate_user_session(user_pool_id: str, username: str) -> None:
             UserPoolId=user_pool_id,
             Username=username,
         )
-        logger.info(f"Invalidated session for user: {masked_username}")
+        logger.info("Invalidated session for user: %s", masked_username)
     except AwsProxyError as exc:
         logger.warning(
-            f"Failed to invalidate session for user {masked_username}: "
-            f"{exc.code}: {exc.message}"
+            "Failed to invalidate session for user %s: %s: %s",
+            masked_username,
+            exc.code,
+            exc.message,
         )
 
 
@@ -111,6 +135,52 @@ def _validate_user_sub(user_sub: str) -> str:
     return normalized
 
 
+def _resolve_username(user_pool_id: str, valid_user_sub: str) -> Optional[str]:
+    """Return the Cognito username for a validated sub, cached per container."""
+    cached = _SUB_TO_USERNAME.get(valid_user_sub)
+    if cached is not None:
+        cached_at, username = cached
+        if time.monotonic() - cached_at < COGNITO_USER_CACHE_TTL_SECONDS:
+            return username
+
+    response = _cognito(
+        "list_users",
+        UserPoolId=user_pool_id,
+        Filter=f'sub = "{valid_user_sub}"',
+        Limit=1,
+    )
+    users = response.get("Users", [])
+    username = users[0].get("Username") if users else None
+    if not username:
+        _SUB_TO_USERNAME.pop(valid_user_sub, None)
+        return None
+
+    _evict_oldest(_SUB_TO_USERNAME)
+    _SUB_TO_USERNAME[valid_user_sub] = (time.monotonic(), username)
+    return username
+
+
+def _forget_cognito_user(username: str) -> None:
+    """Drop cached lookups for a Cognito user."""
+    stale_subs = [
+        sub for sub, (_, cached) in _SUB_TO_USERNAME.items() if cached == username
+    ]
+    for sub in stale_subs:
+        del _SUB_TO_USERNAME[sub]
+    _forget_group_memberships()
+
+
+def _forget_group_memberships() -> None:
+    """Drop cached group memberships after a membership change."""
+    _GROUP_MEMBERSHIPS.clear()
+
+
+def _evict_oldest(cache: dict[str, Any]) -> None:
+    """Keep a per-container cache below its size bound."""
+    while len(cache) >= COGNITO_USER_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+
+
 def _add_user_to_manager_group(user_sub: str) -> None:
     """Add a user to the 'manager' Cognito group (best effort)."""
     valid_user_sub: Optional[str] = None
@@ -118,26 +188,14 @@ def _add_user_to_manager_group(user_sub: str) -> None:
     try:
         valid_user_sub = _validate_user_sub(user_sub)
         user_pool_id = _require_env("COGNITO_USER_POOL_ID")
-        manager_group = os.getenv("MANAGER_GROUP", "manager")
-
-        response = _cognito(
-            "list_users",
-            UserPoolId=user_pool_id,
-            Filter=f'sub = "{valid_user_sub}"',
-            Limit=1,
-        )
+        manager_group = _env_group("MANAGER_GROUP", "manager")
 
-        users = response.get("Users", [])
-        if not users:
+        username = _resolve_username(user_pool_id, valid_user_sub)
+        if not username:
             logger.warning(
-                f"Could not find Cognito user with sub: {mask_pii(user_sub)}"
+                "Could not find Cognito user with sub: %s", mask_pii(user_sub)
             )
             return
-
-        username = users[0].get("Username")
-        if not username:
-            logger.warning(f"User with sub {mask_pii(user_sub)} has no username")
-            return
         masked_username = _mask_cognito_username(username)
 
         groups_response = _cognito(
@@ -145,20 +203,28 @@ def _add_user_to_manager_group(user_sub: str) -> None:
             UserPoolId=user_pool_id,
             Username=username,
         )
-        existing_groups = [g["GroupName"] for g in groups_response.get("Groups", [])]
-
-        if manager_group in existing_groups:
-            logger.info(f"User {masked_username} is already in group {manager_group}")
-            return
+        already_member = any(
+            group.get("GroupName") == manager_group
+            for group in groups_response.get("Groups", [])
+        )
 
+        # The add is idempotent and always issued; the listed groups only
+        # decide whether the user must be signed out to pick up the group.
         _cognito(
             "admin_add_user_to_group",
             UserPoolId=user_pool_id,
             Username=username,
             GroupName=manager_group,
         )
+        if already_member:
+            logger.info(
+                "User %s is already in group %s", masked_username, manager_group
+            )
+            return
+
+        _forget_group_memberships()
         _invalidate_user_session(user_pool_id, username)
-        logger.info(f"Added user {masked_username} to group {manager_group}")
+        logger.info("Added user %s to group %s", masked_username, manager_group)
     except ValidationError as exc:
         logger.warning(
             "Skipped manager group assignment due to invalid user sub",
@@ -209,42 +275,38 @@ def _handle_list_cognito_users(event: Mapping[str, Any]) -> dict[str, Any]:
     try:
         response = _cognito("list_users", **params)
     except AwsProxyError as exc:
-        logger.warning(f"Cognito list_users error: {exc.code}: {exc.message}")
+        logger.warning("Cognito list_users error: %s: %s", exc.code, exc.message)
         if pagination_token and exc.code == "InvalidParameterException":
             raise ValidationError(
                 "Invalid pagination token", field="pagination_token"
             ) from exc
         raise ValidationError(f"Cognito error: {exc.message}") from exc
 
+    users_page = response.get("Users", [])
+    serialized = [(user, _serialize_cognito_user(user)) for user in users_page]
+
+    # Users without a last_auth_time attribute need one admin_get_user
+    # call each; issue those concurrently instead of one after another.
+    last_auth_futures = {
+        username: _submit(_fetch_last_auth_time, user_pool_id, username)
+        for user, user_data in serialized
+        if user_data
+        and (username := user.get("Username"))
+        and not user_data.get("last_auth_time")
+    }
+    # Usually served from the short-lived membership cache.
+    memberships = _load_group_memberships(user_pool_id) if users_page else {}
+
     users = []
-    for user in response.get("Users", []):
-        user_data = _serialize_cognito_user(user)
+    for user, user_data in serialized:
         if user_data:
             username = user.get("Username")
             if username:
-                masked_username = _mask_cognito_username(username)
-                if not user_data.get("last_auth_time"):
-                    last_auth_time = _fetch_last_auth_time(user_pool_id, username)
+                if username in last_auth_futures:
+                    last_auth_time = last_auth_futures[username].result()
                     if last_auth_time:
                         user_data["last_auth_time"] = last_auth_time
-                try:
-                    gr = _cognito(
-                        "admin_list_groups_for_user",
-                        UserPoolId=user_pool_id,
-                        Username=username,
-                    )
-                    groups = gr.get("Groups", [])
-                    user_data["groups"] = [g["GroupName"] for g in groups]
-                except AwsProxyError as exc:
-                    logger.warning(
-                        "Failed to fetch groups for user",
-                        extra={
-                            "username": masked_username,
-                            "error_code": exc.code,
-                            "error_message": exc.message,
-                        },
-                    )
-                    user_data["groups"] = []
+                user_data["groups"] = list(memberships.get(username, ()))
             else:
                 user_data["groups"] = []
             users.append(user_data)
@@ -254,10 +316,61 @@ def _handle_list_cognito_users(event: Mapping[str, Any]) -> dict[str, Any]:
     if next_token:
         result["pagination_token"] = next_token
 
-    logger.info(f"Listed {len(users)} Cognito users")
+    logger.info("Listed %s Cognito users", len(users))
     return json_response(200, result, event=event)
 
 
+def _submit(fn: Callable[..., Any], *args: Any) -> Future[Any]:
+    """Run a Cognito lookup on the shared pool in a copy of the context."""
+    return _COGNITO_EXECUTOR.submit(contextvars.copy_context().run, fn, *args)
+
+
+def _load_group_memberships(user_pool_id: str) -> dict[str, list[str]]:
+    """Map Cognito usernames to their admin and manager group names.
+
+    Pages through the members of the configured groups instead of calling
+    admin_list_groups_for_user for every listed user, and caches the result
+    per container for ``GROUP_MEMBERSHIP_CACHE_TTL_SECONDS``. On failure,
+    logs a warning and returns an empty mapping so users are listed without
+    groups.
+    """
+    cached = _GROUP_MEMBERSHIPS.get(user_pool_id)
+    if cached is not None:
+        cached_at, cached_memberships = cached
+        if time.monotonic() - cached_at < GROUP_MEMBERSHIP_CACHE_TTL_SECONDS:
+            return cached_memberships
+
+    group_names = dict.fromkeys(
+        (_env_group("ADMIN_GROUP", "admin"), _env_group("MANAGER_GROUP", "manager"))
+    )
+    memberships: dict[str, list[str]] = {}
+    try:
+        for group_name in group_names:
+            params: dict[str, Any] = {
+                "UserPoolId": user_pool_id,
+                "GroupName": group_name,
+            }
+            while True:
+                response = _cognito("list_users_in_group", **params)
+                for user in response.get("Users", []):
+                    username = user.get("Username")
+                    if username:
+                        memberships.setdefault(username, []).append(group_name)
+                next_token = response.get("NextToken")
+                if not next_token:
+                    break
+                params["NextToken"] = next_token
+    except AwsProxyError as exc:
+        logger.warning(
+            "Failed to fetch group memberships",
+            extra={"error_code": exc.code, "error_message": exc.message},
+        )
+        return {}
+
+    _GROUP_MEMBERSHIPS[user_pool_id] = (time.monotonic(), memberships)
+    return memberships
+
+
 def _serialize_cognito_user(user: dict[str, Any]) -> Optional[dict[str, Any]]:
     """Serialize a Cognito user for the API response."""
     raw_attributes = user.get("Attributes", [])
@@ -294,7 +407,7 @@ def _adjust_user_feedback_stars(user_sub: str, delta: int) -> None:
     user_pool_id = _require_env("COGNITO_USER_POOL_ID")
     result = _get_user_by_sub(user_pool_id, user_sub)
     if result is None:
-        logger.warning(f"Could not find user for feedback stars: {mask_pii(user_sub)}")
+        logger.warning("Could not find user for feedback stars: %s", mask_pii(user_sub))
         return
     username, attributes = result
     current = _parse_feedback_stars(attributes)
@@ -430,25 +543,23 @@ def _handle_delete_cognito_user(
     if user_sub == fallback_manager_id:
         return json_response(400, {"error": "Cannot delete yourself"}, event=event)
 
-    transferred_count = 0
     with Session(get_engine()) as session:
         _set_session_audit_context(session, event)
         org_repo = OrganizationRepository(session)
-        orgs = org_repo.find_by_manager(user_sub, limit=MAX_ORG_TRANSFER_LIMIT)
-        for org in orgs:
-            org.manager_id = fallback_manager_id
-            org_repo.update(org)
-            transferred_count += 1
+        transferred_count = org_repo.transfer_manager(user_sub, fallback_manager_id)
         session.commit()
 
     logger.info(
-        f"Transferred {transferred_count} orgs from "
-        f"{mask_pii(user_sub)} to {mask_pii(fallback_manager_id)}"
+        "Transferred %s orgs from %s to %s",
+        transferred_count,
+        mask_pii(user_sub),
+        mask_pii(fallback_manager_id),
     )
 
     _invalidate_user_session(user_pool_id, username)
     _cognito("admin_delete_user", UserPoolId=user_pool_id, Username=username)
-    logger.info(f"Deleted Cognito user: {_mask_cognito_username(username)}")
+    _forget_cognito_user(username)
+    logger.info("Deleted Cognito user: %s", _mask_cognito_username(username))
 
     return json_response(
         200,
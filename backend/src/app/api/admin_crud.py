@@ -20,8 +20,7 @@ from app.api.admin_request import (
 )
 from app.db.engine import get_engine
 from app.db.models import Activity, Organization
-from app.db.repositories import ActivityRepository
-from app.exceptions import NotFoundError, ValidationError
+from app.exceptions import AuthorizationError, NotFoundError, ValidationError
 from app.utils import json_response
 from app.utils.logging import get_logger
 
@@ -46,9 +45,12 @@ class RepositoryProtocol(Protocol):
     def delete(self, entity: Any) -> None: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResourceConfig:
-    """Configuration for admin resources."""
+    """Configuration for admin resources.
+
+    Uses slots since a config is read on every admin and manager request.
+    """
 
     name: str
     model: Type[Any]
@@ -79,7 +81,16 @@ def _handle_crud(
     Returns:
         API Gateway response.
     """
-    with Session(get_engine()) as session:
+    # Reject bad requests before a pooled connection is taken for the
+    # audit context.
+    if method not in ("GET", "POST", "PUT", "DELETE"):
+        return json_response(405, {"error": "Method not allowed"}, event=event)
+    if resource_id:
+        _parse_uuid(resource_id)
+
+    # Writes are flushed (with server defaults returned) before commit, so
+    # keeping that state after commit avoids re-SELECTing every row.
+    with Session(get_engine(), expire_on_commit=False) as session:
         # Set audit context for trigger-based audit logging
         _set_session_audit_context(session, event)
 
@@ -89,10 +100,7 @@ def _handle_crud(
             return _crud_post(event, session, config, managed_org_ids)
         if method == "PUT":
             return _crud_put(event, session, config, resource_id, managed_org_ids)
-        if method == "DELETE":
-            return _crud_delete(event, session, config, resource_id, managed_org_ids)
-
-    return json_response(405, {"error": "Method not allowed"}, event=event)
+        return _crud_delete(event, session, config, resource_id, managed_org_ids)
 
 
 def _crud_get(
@@ -108,18 +116,7 @@ def _crud_get(
     repo = config.repository_class(session)
 
     if resource_id:
-        entity = repo.get_by_id(_parse_uuid(resource_id))
-        if entity is None:
-            raise NotFoundError(config.name, resource_id)
-        # Check management if filtering is enabled
-        if managed_org_ids is not None:
-            entity_org_id = _get_entity_org_id(entity, session)
-            if entity_org_id not in managed_org_ids:
-                return json_response(
-                    403,
-                    {"error": "You don't have access to this resource"},
-                    event=event,
-                )
+        entity = _get_managed_entity(session, config, resource_id, managed_org_ids)
         return json_response(200, config.serializer(entity), event=event)
 
     # List resources
@@ -167,9 +164,15 @@ def _crud_post(
         if config.name in ("pricing", "schedules"):
             activity_id = body.get("activity_id")
             if activity_id:
-                activity_repo = ActivityRepository(session)
-                activity = activity_repo.get_by_id(_parse_uuid(activity_id))
-                if activity and str(activity.org_id) not in managed_org_ids:
+                activity_org_id = session.execute(
+                    select(Activity.org_id).where(
+                        Activity.id == _parse_uuid(activity_id)
+                    )
+                ).scalar_one_or_none()
+                if (
+                    activity_org_id is not None
+                    and str(activity_org_id) not in managed_org_ids
+                ):
                     return json_response(
                         403,
                         {"error": "You don't have access to this activity"},
@@ -180,8 +183,7 @@ def _crud_post(
     entity = config.create_handler(repo, body)
     repo.create(entity)
     session.commit()
-    session.refresh(entity)
-    logger.info(f"Created {config.name}: {entity.id}")
+    logger.info("Created %s: %s", config.name, entity.id)
     return json_response(201, config.serializer(entity), event=event)
 
 
@@ -197,19 +199,7 @@ def _crud_put(
         raise ValidationError("Resource id is required", field="id")
 
     repo = config.repository_class(session)
-    entity = repo.get_by_id(_parse_uuid(resource_id))
-    if entity is None:
-        raise NotFoundError(config.name, resource_id)
-
-    # Check management if filtering is enabled
-    if managed_org_ids is not None:
-        entity_org_id = _get_entity_org_id(entity, session)
-        if entity_org_id not in managed_org_ids:
-            return json_response(
-                403,
-                {"error": "You don't have access to this resource"},
-                event=event,
-            )
+    entity = _get_managed_entity(session, config, resource_id, managed_org_ids)
 
     body = _parse_body(event)
 
@@ -222,8 +212,7 @@ def _crud_put(
     updated = update_handler(repo, entity, body)
     repo.update(updated)
     session.commit()
-    session.refresh(updated)
-    logger.info(f"Updated {config.name}: {resource_id}")
+    logger.info("Updated %s: %s", config.name, resource_id)
     return json_response(200, config.serializer(updated), event=event)
 
 
@@ -239,53 +228,50 @@ def _crud_delete(
         raise ValidationError("Resource id is required", field="id")
 
     repo = config.repository_class(session)
-    entity = repo.get_by_id(_parse_uuid(resource_id))
-    if entity is None:
-        raise NotFoundError(config.name, resource_id)
-
-    # Check management if filtering is enabled
-    if managed_org_ids is not None:
-        entity_org_id = _get_entity_org_id(entity, session)
-        if entity_org_id not in managed_org_ids:
-            return json_response(
-                403,
-                {"error": "You don't have access to this resource"},
-                event=event,
-            )
+    entity = _get_managed_entity(session, config, resource_id, managed_org_ids)
 
     repo.delete(entity)
     session.commit()
-    logger.info(f"Deleted {config.name}: {resource_id}")
+    logger.info("Deleted %s: %s", config.name, resource_id)
     return json_response(204, {}, event=event)
 
 
-def _get_entity_org_id(entity: Any, session: Session) -> Optional[str]:
-    """Get the organization ID for an entity.
-
-    Works for:
-    - Organization: the entity's own ID
-    - Location, Activity: direct org_id field
-    - Pricing, Schedule: through activity relationship
-
-    Returns:
-        The organization ID as a string, or None if not determinable.
+def _get_managed_entity(
+    session: Session,
+    config: ResourceConfig,
+    resource_id: str,
+    managed_org_ids: Optional[set[str]],
+) -> Any:
+    """Fetch an entity by ID, enforcing organization management if set.
+
+    The management check is part of the lookup query, so Pricing and
+    Schedule entities no longer need a second query for their activity.
+    Existence is only checked separately when the scoped lookup misses,
+    to tell a 404 apart from a 403.
+
+    Raises:
+        NotFoundError: If the entity does not exist.
+        AuthorizationError: If the entity belongs to an unmanaged organization.
     """
-    # Organization entity - the org_id is the entity itself
-    if isinstance(entity, Organization):
-        return str(entity.id)
-
-    # Direct org_id (Location, Activity)
-    if hasattr(entity, "org_id"):
-        return str(entity.org_id)
+    entity_id = _parse_uuid(resource_id)
 
-    # Through activity (Pricing, Schedule)
-    if hasattr(entity, "activity_id"):
-        activity_repo = ActivityRepository(session)
-        activity = activity_repo.get_by_id(entity.activity_id)
-        if activity:
-            return str(activity.org_id)
+    if managed_org_ids is None:
+        entity = config.repository_class(session).get_by_id(entity_id)
+        if entity is None:
+            raise NotFoundError(config.name, resource_id)
+        return entity
 
-    return None
+    model = config.model
+    query = _org_scoped_query(model, managed_org_ids)
+    if query is not None:
+        entity = session.execute(query.where(model.id == entity_id)).scalars().first()
+        if entity is not None:
+            return entity
+
+    exists = session.execute(select(model.id).where(model.id == entity_id)).first()
+    if exists is None:
+        raise NotFoundError(config.name, resource_id)
+    raise AuthorizationError("You don't have access to this resource")
 
 
 def _get_org_id_from_body(body: dict[str, Any], resource_name: str) -> Optional[str]:
@@ -323,25 +309,32 @@ def _get_all_filtered_by_org(
         Sequence of entities belonging to the managed organizations.
     """
     model = config.model
+    query = _org_scoped_query(model, managed_org_ids)
+    if query is None:
+        return []
+
+    if cursor is not None:
+        query = query.where(model.id > cursor)
+    return session.execute(query.order_by(model.id).limit(limit)).scalars().all()
+
+
+def _org_scoped_query(model: Type[Any], managed_org_ids: set[str]) -> Optional[Any]:
+    """Build a select for model rows belonging to the managed organizations.
 
-    # Build base query based on model type
+    Returns:
+        A select statement, or None if the model is not organization-scoped.
+    """
     if model == Organization:
         # Organization - filter by entity ID
-        query = select(model).where(model.id.in_(managed_org_ids))
-    elif hasattr(model, "org_id"):
+        return select(model).where(model.id.in_(managed_org_ids))
+    if hasattr(model, "org_id"):
         # Direct org_id (Location, Activity)
-        query = select(model).where(model.org_id.in_(managed_org_ids))
-    elif hasattr(model, "activity_id"):
+        return select(model).where(model.org_id.in_(managed_org_ids))
+    if hasattr(model, "activity_id"):
         # Through activity (Pricing, Schedule)
-        query = (
+        return (
             select(model)
             .join(Activity, model.activity_id == Activity.id)
             .where(Activity.org_id.in_(managed_org_ids))
         )
-    else:
-        # Default to empty query
-        return []
-
-    if cursor is not None:
-        query = query.where(model.id > cursor)
-    return session.execute(query.order_by(model.id).limit(limit)).scalars().all()
+    return None
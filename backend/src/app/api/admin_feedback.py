@@ -7,7 +7,6 @@ import os
 from typing import Any, Mapping, Optional
 
 from botocore.exceptions import BotoCoreError, ClientError
-from sqlalchemy import text as sa_text
 from sqlalchemy.orm import Session
 
 from app.api.admin_auth import (
@@ -244,7 +243,7 @@ def _publish_feedback_to_sns(
                 }
             },
         )
-        logger.info(f"Published feedback to SNS: {ticket_id}")
+        logger.info("Published feedback to SNS: %s", ticket_id)
         return json_response(
             202,
             {
@@ -254,7 +253,7 @@ def _publish_feedback_to_sns(
             event=event,
         )
     except (ClientError, BotoCoreError) as exc:
-        logger.exception(f"Failed to publish feedback to SNS: {exc}")
+        logger.exception("Failed to publish feedback to SNS: %s", exc)
         return json_response(
             500,
             {"error": "Failed to submit feedback. Please try again."},
@@ -264,15 +263,7 @@ def _publish_feedback_to_sns(
 
 def _generate_feedback_ticket_id(session: Session) -> str:
     """Generate a unique progressive ticket ID in format F + 5 digits."""
-    result = session.execute(
-        sa_text(
-            "SELECT MAX(CAST(SUBSTRING(ticket_id FROM 2) AS BIGINT)) "
-            "FROM tickets "
-            "WHERE ticket_id LIKE 'F%'"
-        )
-    ).scalar()
-    next_number = (result or 0) + 1
-    return f"F{next_number:05d}"
+    return TicketRepository(session).next_ticket_id("F")
 
 
 def _handle_admin_feedback(
@@ -352,7 +343,9 @@ def _create_feedback(event: Mapping[str, Any]) -> dict[str, Any]:
         required=False,
     )
 
-    with Session(get_engine()) as session:
+    # Keep the created row's state after commit so the response needs no
+    # re-SELECT.
+    with Session(get_engine(), expire_on_commit=False) as session:
         _set_session_audit_context(session, event)
         org_repo = OrganizationRepository(session)
         label_repo = FeedbackLabelRepository(session)
@@ -371,7 +364,6 @@ def _create_feedback(event: Mapping[str, Any]) -> dict[str, Any]:
         )
         repo.create(entity)
         session.commit()
-        session.refresh(entity)
 
     if submitter_id:
         safe_adjust_feedback_stars(
@@ -387,15 +379,16 @@ def _update_feedback(
     feedback_id: str,
 ) -> dict[str, Any]:
     """Update an existing feedback entry."""
+    feedback_uuid = _parse_uuid(feedback_id)
     body = _parse_body(event)
 
-    with Session(get_engine()) as session:
+    with Session(get_engine(), expire_on_commit=False) as session:
         _set_session_audit_context(session, event)
         repo = OrganizationFeedbackRepository(session)
         label_repo = FeedbackLabelRepository(session)
         org_repo = OrganizationRepository(session)
 
-        entity = repo.get_by_id(_parse_uuid(feedback_id))
+        entity = repo.get_by_id(feedback_uuid)
         if entity is None:
             raise NotFoundError("organization_feedback", feedback_id)
 
@@ -436,7 +429,6 @@ def _update_feedback(
 
         repo.update(entity)
         session.commit()
-        session.refresh(entity)
 
     if old_submitter_id != entity.submitter_id:
         delta = feedback_stars_per_approval()
@@ -453,11 +445,12 @@ def _delete_feedback(
     feedback_id: str,
 ) -> dict[str, Any]:
     """Delete a feedback entry."""
+    feedback_uuid = _parse_uuid(feedback_id)
     submitter_id: Optional[str] = None
     with Session(get_engine()) as session:
         _set_session_audit_context(session, event)
         repo = OrganizationFeedbackRepository(session)
-        entity = repo.get_by_id(_parse_uuid(feedback_id))
+        entity = repo.get_by_id(feedback_uuid)
         if entity is None:
             raise NotFoundError("organization_feedback", feedback_id)
         submitter_id = entity.submitter_id
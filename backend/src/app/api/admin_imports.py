@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from typing import Any, Mapping
 
+import orjson
 from botocore.exceptions import ClientError
 from sqlalchemy.orm import Session
 
@@ -113,7 +114,9 @@ def _handle_import_process(event: Mapping[str, Any]) -> dict[str, Any]:
         raise ValidationError("Import file must be a JSON object")
 
     file_warnings: list[str] = []
-    with Session(get_engine()) as session:
+    # Upserts commit per row; the flush already returns server defaults,
+    # so keep row state instead of re-SELECTing after each commit.
+    with Session(get_engine(), expire_on_commit=False) as session:
         _set_session_audit_context(session, event)
         summary, results = process_import_payload(session, payload, file_warnings)
 
@@ -179,10 +182,10 @@ def _load_import_payload(object_key: str) -> dict[str, Any]:
                 field="object_key",
             ) from exc
         raise
-    body = response["Body"].read().decode("utf-8")
+    # orjson parses the raw bytes, so large files skip a full str copy.
     try:
-        return json.loads(body)
-    except json.JSONDecodeError as exc:
+        return orjson.loads(response["Body"].read())
+    except orjson.JSONDecodeError as exc:
         raise ValidationError("Import file must be valid JSON") from exc
 
 
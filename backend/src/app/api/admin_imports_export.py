@@ -214,8 +214,9 @@ def serialize_export_activity(
     tzinfo: ZoneInfo,
     warnings: list[str],
 ) -> dict[str, Any]:
-    age_min = getattr(activity.age_range, "lower", None)
-    age_max = getattr(activity.age_range, "upper", None)
+    age_range = activity.age_range
+    age_min = age_range.lower
+    age_max = age_range.upper
     activity_payload = {
         "name": activity.name,
         "description": activity.description,
@@ -22,7 +22,11 @@ from app.api.admin_resource_organization import (
     _create_organization,
     _update_organization,
 )
-from app.api.admin_resource_pricing import _create_pricing, _update_pricing
+from app.api.admin_resource_pricing import (
+    _create_pricing,
+    _parse_pricing_type,
+    _update_pricing,
+)
 from app.api.admin_resource_schedule import _create_schedule, _update_schedule
 from app.api.admin_validators import (
     MAX_NAME_LENGTH,
@@ -30,7 +34,7 @@ from app.api.admin_validators import (
     _validate_string_length,
 )
 from app.db.models import Activity, ActivityPricing, ActivitySchedule, Location
-from app.db.models import Organization, PricingType
+from app.db.models import Organization
 from app.db.repositories import (
     ActivityPricingRepository,
     ActivityRepository,
@@ -118,7 +122,6 @@ def upsert_organization(
         updated = _update_organization(repo, existing, body)
         repo.update(updated)
         session.commit()
-        session.refresh(updated)
         return updated, "updated"
 
     if not raw_org.get("manager_id"):
@@ -126,7 +129,6 @@ def upsert_organization(
     created = _create_organization(repo, body)
     repo.create(created)
     session.commit()
-    session.refresh(created)
     return created, "created"
 
 
@@ -152,7 +154,6 @@ def upsert_location(
         updated = _update_location(repo, existing, body)
         repo.update(updated)
         session.commit()
-        session.refresh(updated)
         return updated, "updated"
 
     body["org_id"] = str(org.id)
@@ -160,7 +161,6 @@ def upsert_location(
     created = _create_location(repo, body)
     repo.create(created)
     session.commit()
-    session.refresh(created)
     return created, "created"
 
 
@@ -195,14 +195,12 @@ def upsert_activity(
         updated = _update_activity(repo, existing, body)
         repo.update(updated)
         session.commit()
-        session.refresh(updated)
         return updated, "updated"
 
     body["org_id"] = str(org.id)
     created = _create_activity(repo, body)
     repo.create(created)
     session.commit()
-    session.refresh(created)
     return created, "created"
 
 
@@ -215,13 +213,7 @@ def upsert_pricing(
     pricing_type = raw_pricing.get("pricing_type")
     if not pricing_type:
         raise ValidationError("pricing_type is required", field="pricing_type")
-    try:
-        pricing_enum = PricingType(str(pricing_type))
-    except ValueError as exc:
-        raise ValidationError(
-            "Invalid pricing_type",
-            field="pricing_type",
-        ) from exc
+    pricing_enum = _parse_pricing_type(str(pricing_type))
 
     repo = ActivityPricingRepository(session)
     try:
@@ -242,7 +234,6 @@ def upsert_pricing(
         updated = _update_pricing(repo, existing, body)
         repo.update(updated)
         session.commit()
-        session.refresh(updated)
         return updated, "updated"
 
     body["activity_id"] = str(activity.id)
@@ -250,7 +241,6 @@ def upsert_pricing(
     created = _create_pricing(repo, body)
     repo.create(created)
     session.commit()
-    session.refresh(created)
     return created, "created"
 
 
@@ -292,13 +282,11 @@ def upsert_schedule(
         updated = _update_schedule(repo, existing, body)
         repo.update(updated)
         session.commit()
-        session.refresh(updated)
         return updated, "updated"
 
     created = _create_schedule(repo, body)
     repo.create(created)
     session.commit()
-    session.refresh(created)
     return created, "created"
 
 
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import os
 import re
+import secrets
 from datetime import datetime, timedelta, timezone
-from uuid import uuid4
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from app.exceptions import ValidationError
 
 _TIME_RE = re.compile(r"^([01]?\d|2[0-3]):([0-5]\d)$")
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
 
 
 def collect_unknown_fields(
@@ -149,13 +150,13 @@ def build_object_key(prefix: str, file_name: str) -> str:
     base, ext = os.path.splitext(cleaned)
     trimmed_base = base[:40].strip("_") or "file"
     suffix = ext.lower() if ext else ".json"
-    unique = uuid4().hex
+    unique = secrets.token_hex(16)
     return f"{prefix}/{unique}-{trimmed_base}{suffix}"
 
 
 def sanitize_filename(file_name: str) -> str:
     trimmed = file_name.strip() or "import.json"
-    return re.sub(r"[^A-Za-z0-9._-]", "_", trimmed)
+    return _UNSAFE_FILENAME_CHARS.sub("_", trimmed)
 
 
 def validate_object_key(object_key: str, prefix: str) -> None:
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
+import secrets
 from typing import Any, Mapping, Optional
-from urllib.parse import urlparse
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from app.api.admin_request import _parse_body, _parse_uuid, _require_env
+from app.api.admin_validators import MAX_MEDIA_URLS_COUNT
 from app.exceptions import ValidationError
 from app.services.aws_clients import get_s3_client
 from app.utils import json_response
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
 
 
 def _handle_organization_media(
@@ -86,50 +93,79 @@ def _handle_media_delete(
     event: Mapping[str, Any],
     organization_id: UUID,
 ) -> dict[str, Any]:
-    """Delete an organization media file from S3."""
+    """Delete one or more organization media files from S3."""
     body = _parse_body(event)
-    if isinstance(body, dict):
-        object_key = body.get("object_key")
-        media_url = body.get("media_url")
-    else:
-        object_key = None
-        media_url = None
-
-    if object_key:
-        key = str(object_key)
-    elif media_url:
-        key = _extract_media_key(str(media_url))
+    if not isinstance(body, dict):
+        body = {}
+
+    media_urls = body.get("media_urls")
+    if media_urls:
+        keys = _extract_media_keys(media_urls)
+    elif body.get("object_key"):
+        keys = [str(body["object_key"])]
+    elif body.get("media_url"):
+        keys = [_extract_media_key(str(body["media_url"]))]
     else:
         raise ValidationError(
             "media_url or object_key is required",
             field="media_url",
         )
 
-    _validate_media_key(str(organization_id), key)
+    for key in keys:
+        _validate_media_key(str(organization_id), key)
     bucket = _require_env("ORGANIZATION_MEDIA_BUCKET")
 
     client = get_s3_client()
-    client.delete_object(Bucket=bucket, Key=key)
+    if len(keys) == 1:
+        client.delete_object(Bucket=bucket, Key=keys[0])
+    else:
+        # One DeleteObjects round trip instead of one request per key.
+        response = client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+        errors = response.get("Errors")
+        if errors:
+            logger.error(
+                "Failed to delete %d media objects for organization %s: %s",
+                len(errors),
+                organization_id,
+                errors,
+            )
+            raise RuntimeError("Failed to delete organization media")
 
     return json_response(204, {}, event=event)
 
 
+def _extract_media_keys(media_urls: Any) -> list[str]:
+    """Extract unique object keys from a list of media URLs."""
+    if not isinstance(media_urls, list):
+        raise ValidationError("media_urls must be a list", field="media_urls")
+    if len(media_urls) > MAX_MEDIA_URLS_COUNT:
+        raise ValidationError(
+            f"media_urls cannot have more than {MAX_MEDIA_URLS_COUNT} items",
+            field="media_urls",
+        )
+    return list(dict.fromkeys(_extract_media_key(str(url)) for url in media_urls))
+
+
 def _build_media_key(organization_id: str, file_name: str) -> str:
     """Build an S3 object key for a media file."""
     cleaned = _sanitize_media_filename(file_name)
     base, extension = os.path.splitext(cleaned)
     trimmed_base = base[:40].strip("_") or "image"
     suffix = extension.lower() if extension else ""
-    unique = uuid4().hex
+    unique = secrets.token_hex(16)
     return f"organizations/{organization_id}/{unique}-{trimmed_base}{suffix}"
 
 
 def _sanitize_media_filename(file_name: str) -> str:
     """Normalize user-supplied filenames."""
     trimmed = file_name.strip() or "image"
-    return re.sub(r"[^A-Za-z0-9._-]", "_", trimmed)
+    return _UNSAFE_FILENAME_CHARS.sub("_", trimmed)
 
 
+@functools.lru_cache(maxsize=1)
 def _media_base_url() -> str:
     """Return the base URL for organization media."""
     return _require_env("ORGANIZATION_MEDIA_BASE_URL").rstrip("/")
@@ -137,17 +173,15 @@ def _media_base_url() -> str:
 
 def _extract_media_key(media_url: str) -> str:
     """Extract an object key from a media URL."""
-    base_url = _media_base_url()
-    parsed_url = urlparse(media_url)
-    base_parsed = urlparse(base_url)
-
-    if parsed_url.netloc != base_parsed.netloc:
+    base_prefix = f"{_media_base_url()}/"
+    if not media_url.startswith(base_prefix):
         raise ValidationError(
             "media_url is not hosted in the images bucket",
             field="media_url",
         )
 
-    key = parsed_url.path.lstrip("/")
+    key = media_url[len(base_prefix) :].split("?", 1)[0].split("#", 1)[0]
+    key = key.lstrip("/")
     if not key:
         raise ValidationError(
             "media_url must include an object key",
@@ -3,27 +3,39 @@
 from __future__ import annotations
 
 import base64
-import json
+import functools
 import os
-from typing import Any, Mapping, Optional
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, Final, Mapping, Optional
 from uuid import UUID
 
+import orjson
+
 from app.exceptions import ValidationError
 from app.utils import parse_int
 from app.utils.parsers import collect_query_params, first_param
 
-DEFAULT_LIMIT = 50
-DEFAULT_MAX_LIMIT = 200
+DEFAULT_LIMIT: Final[int] = 50
+DEFAULT_MAX_LIMIT: Final[int] = 200
+
+# Packed keyset cursor: created_at (epoch microseconds), format version, id.
+_CREATED_CURSOR: Final[struct.Struct] = struct.Struct(">qB16s")
+_CREATED_CURSOR_VERSION: Final[int] = 0
+_EPOCH: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+# Every cursor we issue is well under this; longer input is rejected unparsed.
+_MAX_CURSOR_LENGTH: Final[int] = 256
 
 
 def _parse_body(event: Mapping[str, Any]) -> dict[str, Any]:
     """Parse JSON request body."""
     raw = event.get("body") or ""
     if event.get("isBase64Encoded"):
-        raw = base64.b64decode(raw).decode("utf-8")
+        raw = base64.b64decode(raw)
     if not raw:
         raise ValidationError("Request body is required")
-    return json.loads(raw)
+    return orjson.loads(raw)
 
 
 def _parse_path(path: str) -> tuple[str, str, Optional[str], Optional[str]]:
@@ -102,9 +114,19 @@ def parse_limit(
     return limit
 
 
-def _parse_uuid(value: str) -> UUID:
-    """Parse a UUID string."""
+@functools.lru_cache(maxsize=4096)
+def _uuid_from_str(value: str) -> UUID:
+    """Parse a UUID string, memoized since the same IDs recur across bodies."""
+    return UUID(value)
+
+
+def _parse_uuid(value: str | UUID) -> UUID:
+    """Parse a UUID string; UUID instances are returned unchanged."""
+    if isinstance(value, UUID):
+        return value
     try:
+        if isinstance(value, str):
+            return _uuid_from_str(value)
         return UUID(value)
     except (ValueError, TypeError) as exc:
         raise ValidationError(f"Invalid UUID: {value}", field="id") from exc
@@ -112,8 +134,6 @@ def _parse_uuid(value: str) -> UUID:
 
 def _to_uuid(value: UUID | str) -> UUID:
     """Normalize a UUID from UUID or string input."""
-    if isinstance(value, UUID):
-        return value
     return _parse_uuid(value)
 
 
@@ -121,17 +141,27 @@ def _parse_group_name(event: Mapping[str, Any]) -> str:
     """Parse the group name from the request."""
     raw = event.get("body") or ""
     if not raw:
-        return os.getenv("ADMIN_GROUP") or "admin"
+        return _env_group("ADMIN_GROUP", "admin")
     if event.get("isBase64Encoded"):
-        raw = base64.b64decode(raw).decode("utf-8")
+        raw = base64.b64decode(raw)
     try:
-        body = json.loads(raw)
-    except json.JSONDecodeError:
+        body = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         body = {}
     group = body.get("group") if isinstance(body, dict) else None
-    return group or os.getenv("ADMIN_GROUP") or "admin"
+    return group or _env_group("ADMIN_GROUP", "admin")
+
 
+# Lambda environment variables are fixed for the life of a container, so
+# lookups are cached per process. Tests that change them must call
+# cache_clear() on these helpers.
+@functools.lru_cache(maxsize=None)
+def _env_group(name: str, default: str) -> str:
+    """Return a Cognito group name configured in the environment."""
+    return os.getenv(name) or default
 
+
+@functools.lru_cache(maxsize=None)
 def _require_env(name: str) -> str:
     """Return a required environment variable value."""
     value = os.getenv(name)
@@ -145,21 +175,58 @@ def _parse_cursor(value: Optional[str]) -> Optional[UUID]:
     if value is None or value == "":
         return None
     try:
-        payload = _decode_cursor(value)
-        return UUID(payload["id"])
+        raw = _decode_cursor_bytes(value)
+        if len(raw) == 16:
+            return UUID(bytes=raw)
+        # JSON cursors issued before the packed form; kept for open pages.
+        return UUID(orjson.loads(raw)["id"])
     except (ValueError, KeyError, TypeError) as exc:
         raise ValidationError("Invalid cursor", field="cursor") from exc
 
 
 def _encode_cursor(value: Any) -> str:
-    """Encode admin cursor."""
-    payload = json.dumps({"id": str(value)}).encode("utf-8")
-    encoded = base64.urlsafe_b64encode(payload).decode("utf-8")
-    return encoded.rstrip("=")
+    """Encode admin cursor as the unpadded URL-safe base64 of the id bytes."""
+    if not isinstance(value, UUID):
+        value = UUID(str(value))
+    return base64.urlsafe_b64encode(value.bytes).decode("ascii").rstrip("=")
+
+
+def _parse_created_cursor(value: Optional[str]) -> Optional[tuple[datetime, UUID]]:
+    """Parse a (created_at, id) keyset cursor for newest-first listings."""
+    if value is None or value == "":
+        return None
+    try:
+        raw = _decode_cursor_bytes(value)
+        micros, version, id_bytes = _CREATED_CURSOR.unpack(raw)
+        if version != _CREATED_CURSOR_VERSION:
+            raise ValueError("Unsupported cursor version")
+        return _EPOCH + micros * _MICROSECOND, UUID(bytes=id_bytes)
+    except (ValueError, TypeError, OverflowError, struct.error) as exc:
+        # OverflowError: crafted micros outside the datetime range.
+        raise ValidationError("Invalid cursor", field="cursor") from exc
+
+
+def _encode_created_cursor(created_at: datetime, value: UUID) -> str:
+    """Encode a (created_at, id) keyset cursor for newest-first listings.
+
+    The cursor is packed into 25 bytes rather than JSON so it stays short
+    and decoding needs no JSON parse.
+    """
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    micros = (created_at - _EPOCH) // _MICROSECOND
+    raw = _CREATED_CURSOR.pack(micros, _CREATED_CURSOR_VERSION, value.bytes)
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
 
 
 def _decode_cursor(cursor: str) -> dict[str, Any]:
-    """Decode admin cursor."""
+    """Decode a JSON cursor payload."""
+    return orjson.loads(_decode_cursor_bytes(cursor))
+
+
+def _decode_cursor_bytes(cursor: str) -> bytes:
+    """Decode unpadded URL-safe base64 cursor text."""
+    if len(cursor) > _MAX_CURSOR_LENGTH:
+        raise ValueError("Cursor too long")
     padding = "=" * (-len(cursor) % 4)
-    raw = base64.urlsafe_b64decode(cursor + padding)
-    return json.loads(raw)
+    return base64.urlsafe_b64decode(cursor + padding)
@@ -53,8 +53,8 @@ def _create_activity(repo: ActivityRepository, body: dict[str, Any]) -> Activity
     if age_min is None or age_max is None:
         raise ValidationError("age_min and age_max are required")
 
-    _validate_age_range(age_min, age_max)
-    age_range = Range(int(age_min), int(age_max), bounds="[]")
+    age_min_val, age_max_val = _validate_age_range(age_min, age_max)
+    age_range = Range(age_min_val, age_max_val, bounds="[]")
 
     category_uuid = _parse_uuid(category_id)
     category_repo = ActivityCategoryRepository(repo.session)
@@ -116,13 +116,13 @@ def _update_activity(
         age_max = body.get("age_max")
         if age_min is None or age_max is None:
             raise ValidationError("age_min and age_max are required together")
-        _validate_age_range(age_min, age_max)
-        entity.age_range = Range(int(age_min), int(age_max), bounds="[]")
+        age_min_val, age_max_val = _validate_age_range(age_min, age_max)
+        entity.age_range = Range(age_min_val, age_max_val, bounds="[]")
     return entity
 
 
-def _validate_age_range(age_min: Any, age_max: Any) -> None:
-    """Validate age range values."""
+def _validate_age_range(age_min: Any, age_max: Any) -> tuple[int, int]:
+    """Validate age range values and return them as integers."""
     try:
         age_min_val = int(age_min)
         age_max_val = int(age_max)
@@ -141,6 +141,7 @@ def _validate_age_range(age_min: Any, age_max: Any) -> None:
         )
     if age_min_val >= age_max_val:
         raise ValidationError("age_min must be less than age_max")
+    return age_min_val, age_max_val
 
 
 def _ensure_unique_activity_name(
@@ -167,8 +168,8 @@ def _ensure_unique_activity_name(
 def _serialize_activity(entity: Activity) -> dict[str, Any]:
     """Serialize an activity."""
     age_range = entity.age_range
-    age_min = getattr(age_range, "lower", None)
-    age_max = getattr(age_range, "upper", None)
+    age_min = age_range.lower
+    age_max = age_range.upper
     return {
         "id": str(entity.id),
         "org_id": str(entity.org_id),
@@ -75,42 +75,36 @@ def _update_location(
             )
         entity.address = address
 
-    lat = body.get("lat", entity.lat) if "lat" in body else entity.lat
-    lng = body.get("lng", entity.lng) if "lng" in body else entity.lng
-
     if "lat" in body or "lng" in body:
+        lat = body.get("lat", entity.lat)
+        lng = body.get("lng", entity.lng)
         _validate_coordinates(lat, lng)
-
-    if "lat" in body:
-        entity.lat = body["lat"]
-    if "lng" in body:
-        entity.lng = body["lng"]
+        entity.lat = lat
+        entity.lng = lng
     return entity
 
 
 def _validate_coordinates(lat: Any, lng: Any) -> None:
     """Validate latitude and longitude values."""
-    if lat is not None:
-        try:
-            lat_val = float(lat)
-            if not -90 <= lat_val <= 90:
-                raise ValidationError(
-                    "lat must be between -90 and 90",
-                    field="lat",
-                )
-        except (ValueError, TypeError) as exc:
-            raise ValidationError("lat must be a valid number", field="lat") from exc
-
-    if lng is not None:
-        try:
-            lng_val = float(lng)
-            if not -180 <= lng_val <= 180:
-                raise ValidationError(
-                    "lng must be between -180 and 180",
-                    field="lng",
-                )
-        except (ValueError, TypeError) as exc:
-            raise ValidationError("lng must be a valid number", field="lng") from exc
+    _validate_coordinate(lat, "lat", 90)
+    _validate_coordinate(lng, "lng", 180)
+
+
+def _validate_coordinate(value: Any, field_name: str, limit: int) -> None:
+    """Validate one optional coordinate against a symmetric bound."""
+    if value is None:
+        return
+    try:
+        parsed = float(value)
+    except (ValueError, TypeError) as exc:
+        raise ValidationError(
+            f"{field_name} must be a valid number", field=field_name
+        ) from exc
+    if not -limit <= parsed <= limit:
+        raise ValidationError(
+            f"{field_name} must be between -{limit} and {limit}",
+            field=field_name,
+        )
 
 
 def _ensure_unique_location_address(
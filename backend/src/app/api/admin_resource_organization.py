@@ -119,18 +119,17 @@ def _update_organization_for_manager(
         if updated_media_urls:
             updated_media_urls = _validate_media_urls(updated_media_urls)
         entity.media_urls = updated_media_urls
-    media_urls_for_logo = (
-        updated_media_urls
-        if updated_media_urls is not None
-        else list(entity.media_urls or [])
-    )
     if "logo_media_url" in body:
         entity.logo_media_url = _validate_logo_media_url(
             body.get("logo_media_url"),
-            media_urls_for_logo,
+            (
+                updated_media_urls
+                if updated_media_urls is not None
+                else entity.media_urls or []
+            ),
         )
     elif updated_media_urls is not None:
-        if entity.logo_media_url and entity.logo_media_url not in media_urls_for_logo:
+        if entity.logo_media_url and entity.logo_media_url not in updated_media_urls:
             entity.logo_media_url = None
     _apply_organization_contact_fields(entity, body)
     return entity
@@ -187,53 +186,9 @@ def _update_organization(
     body: dict[str, Any],
 ) -> Organization:
     """Update an organization."""
-    if "name" in body:
-        name = _validate_string_length(
-            body["name"], "name", MAX_NAME_LENGTH, required=True
-        )
-        if name is None:
-            raise ValidationError("name is required", field="name")
-        _ensure_unique_organization_name(repo, name, current_id=str(entity.id))
-        entity.name = name  # type: ignore[assignment]
-    if "description" in body:
-        entity.description = _validate_string_length(
-            body["description"], "description", MAX_DESCRIPTION_LENGTH
-        )
-    if "name_translations" in body:
-        entity.name_translations = _validate_translations_map(
-            body["name_translations"],
-            "name_translations",
-            MAX_NAME_LENGTH,
-        )
-    if "description_translations" in body:
-        entity.description_translations = _validate_translations_map(
-            body["description_translations"],
-            "description_translations",
-            MAX_DESCRIPTION_LENGTH,
-        )
     if "manager_id" in body:
         entity.manager_id = _validate_manager_id(body["manager_id"], required=True)  # type: ignore[assignment]
-    updated_media_urls: Optional[list[str]] = None
-    if "media_urls" in body:
-        updated_media_urls = _parse_media_urls(body["media_urls"])
-        if updated_media_urls:
-            updated_media_urls = _validate_media_urls(updated_media_urls)
-        entity.media_urls = updated_media_urls
-    media_urls_for_logo = (
-        updated_media_urls
-        if updated_media_urls is not None
-        else list(entity.media_urls or [])
-    )
-    if "logo_media_url" in body:
-        entity.logo_media_url = _validate_logo_media_url(
-            body.get("logo_media_url"),
-            media_urls_for_logo,
-        )
-    elif updated_media_urls is not None:
-        if entity.logo_media_url and entity.logo_media_url not in media_urls_for_logo:
-            entity.logo_media_url = None
-    _apply_organization_contact_fields(entity, body)
-    return entity
+    return _update_organization_for_manager(repo, entity, body)
 
 
 def _serialize_organization(entity: Organization) -> dict[str, Any]:
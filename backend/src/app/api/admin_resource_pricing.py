@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from decimal import Decimal, InvalidOperation
-from typing import Any
+from typing import Any, Final, Mapping
 
 from app.api.admin_request import _parse_uuid
 from app.api.admin_validators import _validate_currency
@@ -11,6 +11,22 @@ from app.db.models import ActivityPricing, PricingType
 from app.db.repositories import ActivityPricingRepository
 from app.exceptions import ValidationError
 
+_PRICING_TYPE_BY_VALUE: Final[Mapping[str, PricingType]] = {
+    member.value: member for member in PricingType
+}
+# Enum .value is a descriptor call; serializers read the value from here.
+_PRICING_TYPE_VALUE: Final[Mapping[PricingType, str]] = {
+    member: member.value for member in PricingType
+}
+
+
+def _parse_pricing_type(value: Any) -> PricingType:
+    """Resolve a pricing_type value to its enum member."""
+    pricing_type = _PRICING_TYPE_BY_VALUE.get(value) if isinstance(value, str) else None
+    if pricing_type is None:
+        raise ValidationError("Invalid pricing_type", field="pricing_type")
+    return pricing_type
+
 
 def _create_pricing(
     repo: ActivityPricingRepository, body: dict[str, Any]
@@ -22,7 +38,7 @@ def _create_pricing(
     if not activity_id or not location_id or not pricing_type:
         raise ValidationError("activity_id, location_id, and pricing_type are required")
 
-    pricing_enum = PricingType(pricing_type)
+    pricing_enum = _parse_pricing_type(pricing_type)
     amount = body.get("amount")
     if pricing_enum == PricingType.FREE:
         amount_value = Decimal("0")
@@ -33,8 +49,7 @@ def _create_pricing(
                 "amount is required unless pricing_type is free",
                 field="amount",
             )
-        _validate_pricing_amount(amount)
-        amount_value = Decimal(str(amount))
+        amount_value = _validate_pricing_amount(amount)
         currency = _validate_currency(body.get("currency") or "HKD")
     free_trial_class_offered = body.get("free_trial_class_offered", False)
     if not isinstance(free_trial_class_offered, bool):
@@ -47,7 +62,7 @@ def _create_pricing(
     if pricing_enum == PricingType.PER_SESSIONS:
         if sessions_count is None:
             raise ValidationError("sessions_count is required for per_sessions pricing")
-        _validate_sessions_count(sessions_count)
+        sessions_count = _validate_sessions_count(sessions_count)
     else:
         sessions_count = None
         free_trial_class_offered = False
@@ -71,21 +86,21 @@ def _update_pricing(
     """Update activity pricing."""
     del repo
     if "pricing_type" in body:
-        entity.pricing_type = PricingType(body["pricing_type"])
+        entity.pricing_type = _parse_pricing_type(body["pricing_type"])
     pricing_type = entity.pricing_type
     if pricing_type == PricingType.FREE:
         entity.amount = Decimal("0")
         entity.currency = _validate_currency("HKD")
     else:
         if "amount" in body:
-            _validate_pricing_amount(body["amount"])
-            entity.amount = Decimal(str(body["amount"]))
+            entity.amount = _validate_pricing_amount(body["amount"])
         if "currency" in body:
             entity.currency = _validate_currency(body["currency"])
     if "sessions_count" in body:
-        if body["sessions_count"] is not None:
-            _validate_sessions_count(body["sessions_count"])
-        entity.sessions_count = body["sessions_count"]
+        sessions_count = body["sessions_count"]
+        if sessions_count is not None:
+            sessions_count = _validate_sessions_count(sessions_count)
+        entity.sessions_count = sessions_count
     if "free_trial_class_offered" in body:
         free_trial_class_offered = body["free_trial_class_offered"]
         if not isinstance(free_trial_class_offered, bool):
@@ -100,10 +115,16 @@ def _update_pricing(
     return entity
 
 
-def _validate_pricing_amount(amount: Any) -> None:
-    """Validate pricing amount."""
+def _validate_pricing_amount(amount: Any) -> Decimal:
+    """Validate pricing amount and return it as a Decimal."""
     try:
-        amount_val = Decimal(str(amount))
+        if isinstance(amount, bool):
+            raise TypeError("amount must not be a boolean")
+        if isinstance(amount, (Decimal, int)):
+            amount_val = Decimal(amount)
+        else:
+            # Going through str() keeps floats at their shortest repr.
+            amount_val = Decimal(str(amount))
     except (InvalidOperation, TypeError, ValueError) as exc:
         raise ValidationError(
             "amount must be a valid number",
@@ -115,10 +136,11 @@ def _validate_pricing_amount(amount: Any) -> None:
             "amount must be at least 0",
             field="amount",
         )
+    return amount_val
 
 
-def _validate_sessions_count(sessions_count: Any) -> None:
-    """Validate sessions count."""
+def _validate_sessions_count(sessions_count: Any) -> int:
+    """Validate sessions count and return it as an integer."""
     try:
         count = int(sessions_count)
     except (ValueError, TypeError) as exc:
@@ -132,6 +154,7 @@ def _validate_sessions_count(sessions_count: Any) -> None:
             "sessions_count must be greater than 0",
             field="sessions_count",
         )
+    return count
 
 
 def _serialize_pricing(entity: ActivityPricing) -> dict[str, Any]:
@@ -140,7 +163,7 @@ def _serialize_pricing(entity: ActivityPricing) -> dict[str, Any]:
         "id": str(entity.id),
         "activity_id": str(entity.activity_id),
         "location_id": str(entity.location_id),
-        "pricing_type": entity.pricing_type.value,
+        "pricing_type": _PRICING_TYPE_VALUE[entity.pricing_type],
         "amount": entity.amount,
         "currency": entity.currency,
         "sessions_count": entity.sessions_count,
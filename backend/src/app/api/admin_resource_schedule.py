@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+from operator import attrgetter
+from typing import Any, Final, Mapping
 from uuid import UUID
 
 from app.api.admin_request import _parse_uuid
@@ -15,6 +16,18 @@ from app.db.models import (
 from app.db.repositories import ActivityScheduleRepository
 from app.exceptions import ValidationError
 
+# Enum .value is a descriptor call; the serializer reads the value from here.
+_SCHEDULE_TYPE_VALUE: Final[Mapping[ScheduleType, str]] = {
+    member: member.value for member in ScheduleType
+}
+
+# Sort and identity key for schedule entries.
+_entry_sort_key = attrgetter(
+    "day_of_week_utc",
+    "start_minutes_utc",
+    "end_minutes_utc",
+)
+
 
 def _create_schedule(
     repo: ActivityScheduleRepository, body: dict[str, Any]
@@ -70,7 +83,7 @@ def _serialize_schedule(entity: ActivitySchedule) -> dict[str, Any]:
         "id": str(entity.id),
         "activity_id": str(entity.activity_id),
         "location_id": str(entity.location_id),
-        "schedule_type": entity.schedule_type.value,
+        "schedule_type": _SCHEDULE_TYPE_VALUE[entity.schedule_type],
         "weekly_entries": [
             {
                 "day_of_week_utc": entry.day_of_week_utc,
@@ -109,16 +122,13 @@ def _parse_weekly_entries(value: Any) -> list[ActivityScheduleEntry]:
                 field=f"weekly_entries[{index}]",
             )
         day_of_week = _parse_int_field(
-            raw.get("day_of_week_utc"),
-            f"weekly_entries[{index}].day_of_week_utc",
+            raw.get("day_of_week_utc"), index, "day_of_week_utc"
         )
         start_minutes = _parse_int_field(
-            raw.get("start_minutes_utc"),
-            f"weekly_entries[{index}].start_minutes_utc",
+            raw.get("start_minutes_utc"), index, "start_minutes_utc"
         )
         end_minutes = _parse_int_field(
-            raw.get("end_minutes_utc"),
-            f"weekly_entries[{index}].end_minutes_utc",
+            raw.get("end_minutes_utc"), index, "end_minutes_utc"
         )
         entries.append(
             ActivityScheduleEntry(
@@ -130,13 +140,15 @@ def _parse_weekly_entries(value: Any) -> list[ActivityScheduleEntry]:
     return entries
 
 
-def _parse_int_field(value: Any, field_name: str) -> int:
-    """Parse required integer fields."""
+def _parse_int_field(value: Any, index: int, name: str) -> int:
+    """Parse a required integer field of the weekly entry at ``index``."""
     if value is None:
+        field_name = f"weekly_entries[{index}].{name}"
         raise ValidationError(f"{field_name} is required", field=field_name)
     try:
         return int(value)
     except (TypeError, ValueError) as exc:
+        field_name = f"weekly_entries[{index}].{name}"
         raise ValidationError(
             f"{field_name} must be an integer",
             field=field_name,
@@ -156,57 +168,50 @@ def _validate_schedule(schedule: ActivitySchedule) -> None:
 
     seen: set[tuple[int, int, int]] = set()
     for index, entry in enumerate(schedule.entries):
-        field_prefix = f"weekly_entries[{index}]"
-        _validate_entry(entry, field_prefix)
-        key = (
-            entry.day_of_week_utc,
-            entry.start_minutes_utc,
-            entry.end_minutes_utc,
-        )
+        _validate_entry(entry, index)
+        key = _entry_sort_key(entry)
         if key in seen:
             raise ValidationError(
                 "weekly_entries must not contain duplicates",
-                field=field_prefix,
+                field=f"weekly_entries[{index}]",
             )
         seen.add(key)
 
 
-def _validate_entry(entry: ActivityScheduleEntry, field_prefix: str) -> None:
+def _validate_entry(entry: ActivityScheduleEntry, index: int) -> None:
     """Validate a weekly entry."""
     day_of_week = entry.day_of_week_utc
+    start_minutes = entry.start_minutes_utc
+    end_minutes = entry.end_minutes_utc
+    # Valid entries take this single combined check; the field-specific
+    # errors below (and their field names) are only built on failure.
+    if (
+        0 <= day_of_week <= 6
+        and 0 <= start_minutes <= 1439
+        and 0 <= end_minutes <= 1439
+        and start_minutes != end_minutes
+    ):
+        return
+
+    field_prefix = f"weekly_entries[{index}]"
     if not 0 <= day_of_week <= 6:
         raise ValidationError(
             "day_of_week_utc must be between 0 and 6",
             field=f"{field_prefix}.day_of_week_utc",
         )
-
-    start_minutes = entry.start_minutes_utc
     if not 0 <= start_minutes <= 1439:
         raise ValidationError(
             "start_minutes_utc must be between 0 and 1439",
             field=f"{field_prefix}.start_minutes_utc",
         )
-
-    end_minutes = entry.end_minutes_utc
     if not 0 <= end_minutes <= 1439:
         raise ValidationError(
             "end_minutes_utc must be between 0 and 1439",
             field=f"{field_prefix}.end_minutes_utc",
         )
-
-    if start_minutes == end_minutes:
-        raise ValidationError(
-            "start_minutes_utc must not equal end_minutes_utc",
-            field=f"{field_prefix}.start_minutes_utc",
-        )
-
-
-def _entry_sort_key(entry: ActivityScheduleEntry) -> tuple[int, int, int]:
-    """Sort key for schedule entries."""
-    return (
-        entry.day_of_week_utc,
-        entry.start_minutes_utc,
-        entry.end_minutes_utc,
+    raise ValidationError(
+        "start_minutes_utc must not equal end_minutes_utc",
+        field=f"{field_prefix}.start_minutes_utc",
     )
 
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Final, Mapping
+
 from app.api.admin_crud import ResourceConfig
 from app.api.admin_resource_activity import (
     _create_activity,
@@ -97,62 +100,64 @@ __all__ = [
 ]
 
 
-_RESOURCE_CONFIG = {
-    "organizations": ResourceConfig(
-        name="organizations",
-        model=Organization,
-        repository_class=OrganizationRepository,
-        serializer=_serialize_organization,
-        create_handler=_create_organization,
-        update_handler=_update_organization,
-        manager_update_handler=_update_organization_for_manager,
-    ),
-    "locations": ResourceConfig(
-        name="locations",
-        model=Location,
-        repository_class=LocationRepository,
-        serializer=_serialize_location,
-        create_handler=_create_location,
-        update_handler=_update_location,
-    ),
-    "activity-categories": ResourceConfig(
-        name="activity-categories",
-        model=ActivityCategory,
-        repository_class=ActivityCategoryRepository,
-        serializer=_serialize_activity_category,
-        create_handler=_create_activity_category,
-        update_handler=_update_activity_category,
-    ),
-    "feedback-labels": ResourceConfig(
-        name="feedback-labels",
-        model=FeedbackLabel,
-        repository_class=FeedbackLabelRepository,
-        serializer=_serialize_feedback_label,
-        create_handler=_create_feedback_label,
-        update_handler=_update_feedback_label,
-    ),
-    "activities": ResourceConfig(
-        name="activities",
-        model=Activity,
-        repository_class=ActivityRepository,
-        serializer=_serialize_activity,
-        create_handler=_create_activity,
-        update_handler=_update_activity,
-    ),
-    "pricing": ResourceConfig(
-        name="pricing",
-        model=ActivityPricing,
-        repository_class=ActivityPricingRepository,
-        serializer=_serialize_pricing,
-        create_handler=_create_pricing,
-        update_handler=_update_pricing,
-    ),
-    "schedules": ResourceConfig(
-        name="schedules",
-        model=ActivitySchedule,
-        repository_class=ActivityScheduleRepository,
-        serializer=_serialize_schedule,
-        create_handler=_create_schedule,
-        update_handler=_update_schedule,
-    ),
-}
+_RESOURCE_CONFIG: Final[Mapping[str, ResourceConfig]] = MappingProxyType(
+    {
+        "organizations": ResourceConfig(
+            name="organizations",
+            model=Organization,
+            repository_class=OrganizationRepository,
+            serializer=_serialize_organization,
+            create_handler=_create_organization,
+            update_handler=_update_organization,
+            manager_update_handler=_update_organization_for_manager,
+        ),
+        "locations": ResourceConfig(
+            name="locations",
+            model=Location,
+            repository_class=LocationRepository,
+            serializer=_serialize_location,
+            create_handler=_create_location,
+            update_handler=_update_location,
+        ),
+        "activity-categories": ResourceConfig(
+            name="activity-categories",
+            model=ActivityCategory,
+            repository_class=ActivityCategoryRepository,
+            serializer=_serialize_activity_category,
+            create_handler=_create_activity_category,
+            update_handler=_update_activity_category,
+        ),
+        "feedback-labels": ResourceConfig(
+            name="feedback-labels",
+            model=FeedbackLabel,
+            repository_class=FeedbackLabelRepository,
+            serializer=_serialize_feedback_label,
+            create_handler=_create_feedback_label,
+            update_handler=_update_feedback_label,
+        ),
+        "activities": ResourceConfig(
+            name="activities",
+            model=Activity,
+            repository_class=ActivityRepository,
+            serializer=_serialize_activity,
+            create_handler=_create_activity,
+            update_handler=_update_activity,
+        ),
+        "pricing": ResourceConfig(
+            name="pricing",
+            model=ActivityPricing,
+            repository_class=ActivityPricingRepository,
+            serializer=_serialize_pricing,
+            create_handler=_create_pricing,
+            update_handler=_update_pricing,
+        ),
+        "schedules": ResourceConfig(
+            name="schedules",
+            model=ActivitySchedule,
+            repository_class=ActivityScheduleRepository,
+            serializer=_serialize_schedule,
+            create_handler=_create_schedule,
+            update_handler=_update_schedule,
+        ),
+    }
+)
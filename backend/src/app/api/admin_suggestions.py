@@ -7,7 +7,6 @@ import os
 from typing import Any, Mapping, Optional
 
 from botocore.exceptions import BotoCoreError, ClientError
-from sqlalchemy import text as sa_text
 from sqlalchemy.orm import Session
 
 from app.api.admin_auth import (
@@ -187,16 +186,7 @@ def _submit_organization_suggestion(
 
 def _generate_suggestion_ticket_id(session: Session) -> str:
     """Generate a unique progressive ticket ID in format S + 5 digits."""
-    result = session.execute(
-        sa_text(
-            "SELECT MAX(CAST(SUBSTRING(ticket_id FROM 2) AS BIGINT)) "
-            "FROM tickets "
-            "WHERE ticket_id LIKE 'S%'"
-        )
-    ).scalar()
-
-    next_number = (result or 0) + 1
-    return f"S{next_number:05d}"
+    return TicketRepository(session).next_ticket_id("S")
 
 
 def _publish_suggestion_to_sns(
@@ -242,7 +232,7 @@ def _publish_suggestion_to_sns(
                 },
             },
         )
-        logger.info(f"Published suggestion to SNS: {ticket_id}")
+        logger.info("Published suggestion to SNS: %s", ticket_id)
         return json_response(
             202,
             {
@@ -252,7 +242,7 @@ def _publish_suggestion_to_sns(
             event=event,
         )
     except (ClientError, BotoCoreError) as exc:
-        logger.exception(f"Failed to publish suggestion to SNS: {exc}")
+        logger.exception("Failed to publish suggestion to SNS: %s", exc)
         return json_response(
             500,
             {"error": "Failed to submit suggestion. Please try again."},
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import json
 import os
+from typing import Any, Sequence
 
 from botocore.exceptions import BotoCoreError, ClientError
 
 from app.db.models import Ticket, TicketType
-from app.services.email import send_email, send_templated_email
+from app.services.aws_clients import get_sns_client
+from app.services.email import send_bulk_templated_email, send_email
 from app.templates import (
     build_request_decision_template_data,
     render_request_decision_email,
@@ -16,6 +19,49 @@ from app.utils.logging import get_logger, mask_email
 
 logger = get_logger(__name__)
 
+TICKET_DECISION_EVENT_TYPE = "ticket.decided"
+
+
+def _publish_ticket_decision(
+    ticket: Ticket,
+    action: str,
+    admin_notes: str,
+) -> None:
+    """Queue the ticket decision email for the ticket processor.
+
+    The decision is published to the manager request topic so the SES call
+    happens in the SQS-driven processor instead of the admin request. When
+    the topic is not configured or publishing fails, the email is sent
+    inline so the submitter is still notified.
+    """
+    topic_arn = os.getenv("MANAGER_REQUEST_TOPIC_ARN")
+    if not topic_arn:
+        _send_ticket_decision_email(ticket, action, admin_notes)
+        return
+
+    try:
+        get_sns_client().publish(
+            TopicArn=topic_arn,
+            Message=json.dumps(
+                {
+                    "event_type": TICKET_DECISION_EVENT_TYPE,
+                    "ticket_id": ticket.ticket_id,
+                    "action": action,
+                    "admin_notes": admin_notes,
+                }
+            ),
+            MessageAttributes={
+                "event_type": {
+                    "DataType": "String",
+                    "StringValue": TICKET_DECISION_EVENT_TYPE,
+                },
+            },
+        )
+        logger.info("Published ticket decision to SNS: %s", ticket.ticket_id)
+    except (ClientError, BotoCoreError) as exc:
+        logger.error("Failed to publish ticket decision, sending inline: %s", exc)
+        _send_ticket_decision_email(ticket, action, admin_notes)
+
 
 def _send_ticket_decision_email(
     ticket: Ticket,
@@ -23,72 +69,129 @@ def _send_ticket_decision_email(
     admin_notes: str,
 ) -> None:
     """Send email notification to submitter about their ticket decision."""
+    _send_ticket_decision_emails([(ticket, action, admin_notes)])
+
+
+def _send_ticket_decision_emails(
+    decisions: Sequence[tuple[Ticket, str, str]],
+) -> None:
+    """Send decision emails for a batch of reviewed tickets.
+
+    Decisions whose ticket type has an SES template configured are grouped
+    per template and sent with one bulk call per 50 recipients; the rest
+    are rendered and sent individually.
+    """
     sender_email = os.getenv("SES_SENDER_EMAIL")
 
     if not sender_email:
         logger.warning("Email notification skipped: SES_SENDER_EMAIL not configured")
         return
 
-    if not ticket.submitter_email or ticket.submitter_email == "unknown":
-        logger.warning(
-            f"Email notification skipped: No valid email for ticket {ticket.ticket_id}"
+    templated: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+    templated_ticket_ids: dict[str, list[str]] = {}
+    for ticket, action, admin_notes in decisions:
+        if not ticket.submitter_email or ticket.submitter_email == "unknown":
+            logger.warning(
+                "Email notification skipped: No valid email for ticket %s",
+                ticket.ticket_id,
+            )
+            continue
+
+        template_name = _decision_template_name(ticket)
+        if not template_name:
+            _send_rendered_decision_email(sender_email, ticket, action, admin_notes)
+            continue
+
+        template_data = _decision_template_data(ticket, action, admin_notes)
+        templated.setdefault(template_name, []).append(
+            (ticket.submitter_email, template_data)
         )
-        return
+        templated_ticket_ids.setdefault(template_name, []).append(ticket.ticket_id)
+
+    for template_name, destinations in templated.items():
+        ticket_ids = ", ".join(templated_ticket_ids[template_name])
+        try:
+            send_bulk_templated_email(
+                source=sender_email,
+                template_name=template_name,
+                destinations=destinations,
+            )
+            logger.info("Ticket decision emails sent for %s", ticket_ids)
+        except (ClientError, BotoCoreError, ValueError) as exc:
+            logger.error(
+                "Failed to send ticket decision emails for %s: %s", ticket_ids, exc
+            )
 
+
+def _decision_template_name(ticket: Ticket) -> str:
+    """Return the configured SES decision template for a ticket type."""
+    if ticket.ticket_type == TicketType.ACCESS_REQUEST:
+        return os.getenv("SES_TEMPLATE_REQUEST_DECISION", "")
+    if ticket.ticket_type == TicketType.ORGANIZATION_SUGGESTION:
+        return os.getenv("SES_TEMPLATE_SUGGESTION_DECISION", "")
+    return os.getenv("SES_TEMPLATE_FEEDBACK_DECISION", "")
+
+
+def _decision_template_data(
+    ticket: Ticket,
+    action: str,
+    admin_notes: str,
+) -> dict[str, Any]:
+    """Build SES template data for a ticket decision."""
+    if ticket.ticket_type == TicketType.ACCESS_REQUEST:
+        return build_request_decision_template_data(
+            ticket_id=ticket.ticket_id,
+            organization_name=ticket.organization_name,
+            reviewed_at=_reviewed_at(ticket),
+            action=action,
+            admin_message=admin_notes if admin_notes else None,
+        )
+    if ticket.ticket_type == TicketType.ORGANIZATION_SUGGESTION:
+        status_text, status_message = _suggestion_status(ticket, action)
+        return {
+            "ticket_id": ticket.ticket_id,
+            "organization_name": ticket.organization_name,
+            "status_text": status_text,
+            "status_message": status_message,
+            "admin_message": admin_notes or "",
+        }
+    return {
+        "ticket_id": ticket.ticket_id,
+        "organization_name": ticket.organization_name,
+        "status_message": _feedback_status(ticket, action),
+        "admin_message": admin_notes or "",
+    }
+
+
+def _send_rendered_decision_email(
+    sender_email: str,
+    ticket: Ticket,
+    action: str,
+    admin_notes: str,
+) -> None:
+    """Render and send a single decision email without an SES template."""
     try:
         if ticket.ticket_type == TicketType.ACCESS_REQUEST:
-            template_name = os.getenv("SES_TEMPLATE_REQUEST_DECISION", "")
-            template_data = build_request_decision_template_data(
-                ticket_id=ticket.ticket_id,
-                organization_name=ticket.organization_name,
-                reviewed_at=(
-                    ticket.reviewed_at.isoformat() if ticket.reviewed_at else "Unknown"
-                ),
-                action=action,
-                admin_message=admin_notes if admin_notes else None,
-            )
             email_content = render_request_decision_email(
                 ticket_id=ticket.ticket_id,
                 organization_name=ticket.organization_name,
-                reviewed_at=(
-                    ticket.reviewed_at.isoformat() if ticket.reviewed_at else "Unknown"
-                ),
+                reviewed_at=_reviewed_at(ticket),
                 action=action,
                 admin_message=admin_notes if admin_notes else None,
             )
-
-            if template_name:
-                send_templated_email(
-                    source=sender_email,
-                    to_addresses=[ticket.submitter_email],
-                    template_name=template_name,
-                    template_data=template_data,
-                )
-            else:
-                send_email(
-                    source=sender_email,
-                    to_addresses=[ticket.submitter_email],
-                    subject=email_content.subject,
-                    body_text=email_content.body_text,
-                    body_html=email_content.body_html,
-                )
+            send_email(
+                source=sender_email,
+                to_addresses=[ticket.submitter_email],
+                subject=email_content.subject,
+                body_text=email_content.body_text,
+                body_html=email_content.body_html,
+            )
         elif ticket.ticket_type == TicketType.ORGANIZATION_SUGGESTION:
             if action == "approve":
                 subject = f"Your place suggestion {ticket.ticket_id} has been approved!"
-                status_text = "APPROVED"
-                status_message = (
-                    "Great news! Your suggestion for "
-                    f"'{ticket.organization_name}' has been approved "
-                    "and added to our platform."
-                )
             else:
                 subject = f"Update on your place suggestion {ticket.ticket_id}"
-                status_text = "DECLINED"
-                status_message = (
-                    f"Thank you for suggesting '{ticket.organization_name}'. "
-                    "Unfortunately, we were unable to add this place "
-                    "to our platform at this time."
-                )
+            _, status_message = _suggestion_status(ticket, action)
 
             body_text = f"{status_message}\n\n"
             if admin_notes:
@@ -97,75 +200,69 @@ def _send_ticket_decision_email(
                 "\nWe appreciate your contribution and encourage "
                 "you to submit other suggestions in the future!"
             )
-
-            template_name = os.getenv("SES_TEMPLATE_SUGGESTION_DECISION", "")
-            if template_name:
-                send_templated_email(
-                    source=sender_email,
-                    to_addresses=[ticket.submitter_email],
-                    template_name=template_name,
-                    template_data={
-                        "ticket_id": ticket.ticket_id,
-                        "organization_name": ticket.organization_name,
-                        "status_text": status_text,
-                        "status_message": status_message,
-                        "admin_message": admin_notes or "",
-                    },
-                )
-            else:
-                send_email(
-                    source=sender_email,
-                    to_addresses=[ticket.submitter_email],
-                    subject=subject,
-                    body_text=body_text,
-                )
+            send_email(
+                source=sender_email,
+                to_addresses=[ticket.submitter_email],
+                subject=subject,
+                body_text=body_text,
+            )
         else:
             if action == "approve":
                 subject = "Your feedback has been approved! " f"[{ticket.ticket_id}]"
-                status_message = (
-                    f"Thanks for your feedback about '{ticket.organization_name}'. "
-                    "It has been approved by our team."
-                )
             else:
                 subject = "Update on your feedback " f"[{ticket.ticket_id}]"
-                status_message = (
-                    "Thank you for your feedback. "
-                    "Unfortunately, we were unable to approve it at this time."
-                )
 
-            body_text = f"{status_message}\n\n"
+            body_text = f"{_feedback_status(ticket, action)}\n\n"
             if admin_notes:
                 body_text += f"Note from admin: {admin_notes}\n"
             body_text += (
                 "\nYou can submit another feedback entry now that this "
                 "one has been reviewed."
             )
-
-            template_name = os.getenv("SES_TEMPLATE_FEEDBACK_DECISION", "")
-            if template_name:
-                send_templated_email(
-                    source=sender_email,
-                    to_addresses=[ticket.submitter_email],
-                    template_name=template_name,
-                    template_data={
-                        "ticket_id": ticket.ticket_id,
-                        "organization_name": ticket.organization_name,
-                        "status_message": status_message,
-                        "admin_message": admin_notes or "",
-                    },
-                )
-            else:
-                send_email(
-                    source=sender_email,
-                    to_addresses=[ticket.submitter_email],
-                    subject=subject,
-                    body_text=body_text,
-                )
+            send_email(
+                source=sender_email,
+                to_addresses=[ticket.submitter_email],
+                subject=subject,
+                body_text=body_text,
+            )
 
         logger.info(
-            f"Ticket decision email sent to "
-            f"{mask_email(ticket.submitter_email)} "
-            f"for {ticket.ticket_id}"
+            "Ticket decision email sent to %s for %s",
+            mask_email(ticket.submitter_email),
+            ticket.ticket_id,
         )
     except (ClientError, BotoCoreError, ValueError) as exc:
-        logger.error(f"Failed to send ticket decision email: {exc}")
+        logger.error("Failed to send ticket decision email: %s", exc)
+
+
+def _reviewed_at(ticket: Ticket) -> str:
+    """Return the review timestamp shown in decision emails."""
+    return ticket.reviewed_at.isoformat() if ticket.reviewed_at else "Unknown"
+
+
+def _suggestion_status(ticket: Ticket, action: str) -> tuple[str, str]:
+    """Return status text and message for a suggestion decision."""
+    if action == "approve":
+        return "APPROVED", (
+            "Great news! Your suggestion for "
+            f"'{ticket.organization_name}' has been approved "
+            "and added to our platform."
+        )
+    return "DECLINED", (
+        f"Thank you for suggesting '{ticket.organization_name}'. "
+        "Unfortunately, we were unable to add this place "
+        "to our platform at this time."
+    )
+
+
+def _feedback_status(ticket: Ticket, action: str) -> str:
+    """Return the status message for a feedback decision."""
+    if action == "approve":
+        return (
+            f"Thanks for your feedback about '{ticket.organization_name}'. "
+            "It has been approved by our team."
+        )
+    return (
+        "Thank you for your feedback. "
+        "Unfortunately, we were unable to approve it at this time."
+    )
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Mapping, Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from app.api.admin_cognito import _add_user_to_manager_group
 from app.db.models import (
     Location,
     Organization,
@@ -28,26 +28,42 @@ from app.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class TicketApproval:
+    """Outputs of an approval that the caller applies after commit."""
+
+    organization: Optional[Organization] = None
+    feedback_star_delta: int = 0
+    new_manager_sub: Optional[str] = None
+
+
 def apply_ticket_approval(
     session: Session,
     ticket: Ticket,
     body: Mapping[str, Any],
     reviewer_sub: str,
-) -> tuple[Optional[Organization], int]:
-    """Apply approval side-effects for a ticket and return derived outputs."""
+) -> TicketApproval:
+    """Apply approval database changes for a ticket.
+
+    Cognito updates are not made here; they are returned so the caller can
+    run them after the transaction commits.
+    """
     if ticket.ticket_type == TicketType.ACCESS_REQUEST:
         organization = _approve_access_request(session, ticket, body)
-        return organization, 0
+        return TicketApproval(
+            organization=organization,
+            new_manager_sub=ticket.submitter_id,
+        )
 
     if ticket.ticket_type == TicketType.ORGANIZATION_SUGGESTION:
         organization = _approve_suggestion(session, ticket, body, reviewer_sub)
-        return organization, 0
+        return TicketApproval(organization=organization)
 
     if ticket.ticket_type == TicketType.ORGANIZATION_FEEDBACK:
         feedback_star_delta = _approve_feedback(session, ticket)
-        return None, feedback_star_delta
+        return TicketApproval(feedback_star_delta=feedback_star_delta)
 
-    return None, 0
+    return TicketApproval()
 
 
 def _approve_access_request(
@@ -80,13 +96,11 @@ def _approve_access_request(
                 "Invalid organization_id",
                 field="organization_id",
             ) from exc
-        organization = org_repo.get_by_id(parsed_org_id)
+        organization = org_repo.assign_manager(parsed_org_id, ticket.submitter_id)
         if organization is None:
             raise NotFoundError("organization", str(organization_id))
-        organization.manager_id = ticket.submitter_id
-        org_repo.update(organization)
         logger.info(
-            f"Assigned organization {organization_id} to user {ticket.submitter_id}"
+            "Assigned organization %s to user %s", organization_id, ticket.submitter_id
         )
     elif create_organization:
         organization = Organization(
@@ -97,11 +111,11 @@ def _approve_access_request(
         )
         org_repo.create(organization)
         logger.info(
-            f"Created organization '{ticket.organization_name}' "
-            f"for user {ticket.submitter_id}"
+            "Created organization '%s' for user %s",
+            ticket.organization_name,
+            ticket.submitter_id,
         )
 
-    _add_user_to_manager_group(ticket.submitter_id)
     return organization
 
 
@@ -120,8 +134,9 @@ def _approve_suggestion(
     _approve_location_creation(session, ticket, organization)
     ticket.created_organization_id = organization.id
     logger.info(
-        f"Created organization '{ticket.organization_name}' "
-        f"from suggestion {ticket.ticket_id}"
+        "Created organization '%s' from suggestion %s",
+        ticket.organization_name,
+        ticket.ticket_id,
     )
     return organization
 
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import contextvars
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Any, Mapping, Optional
+from functools import partial
+from typing import Any, Callable, Mapping, Optional, Sequence
 
 from botocore.exceptions import BotoCoreError, ClientError
-from sqlalchemy import text as sa_text
 from sqlalchemy.orm import Session
 
 from app.api.admin_auth import (
@@ -16,16 +18,17 @@ from app.api.admin_auth import (
     _get_user_sub,
     _set_session_audit_context,
 )
+from app.api.admin_cognito import _add_user_to_manager_group
 from app.api.admin_request import (
-    _encode_cursor,
+    _encode_created_cursor,
     _parse_body,
-    _parse_cursor,
+    _parse_created_cursor,
     _parse_uuid,
     _query_param,
     parse_limit,
 )
-from app.api.admin_ticket_notifications import _send_ticket_decision_email
-from app.api.admin_ticket_review import apply_ticket_approval
+from app.api.admin_ticket_notifications import _publish_ticket_decision
+from app.api.admin_ticket_review import TicketApproval, apply_ticket_approval
 from app.api.admin_validators import (
     MAX_DESCRIPTION_LENGTH,
     MAX_NAME_LENGTH,
@@ -49,6 +52,11 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Shared by post-review side effects; warm containers reuse the threads.
+_SIDE_EFFECT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=3, thread_name_prefix="ticket-review"
+)
+
 
 def _handle_user_access_request(
     event: Mapping[str, Any],
@@ -180,7 +188,7 @@ def _publish_manager_request_to_sns(
             },
         )
 
-        logger.info(f"Published manager request to SNS: {ticket_id}")
+        logger.info("Published manager request to SNS: %s", ticket_id)
 
         return json_response(
             202,
@@ -192,7 +200,7 @@ def _publish_manager_request_to_sns(
         )
 
     except (ClientError, BotoCoreError) as exc:
-        logger.exception(f"Failed to publish manager request to SNS: {exc}")
+        logger.exception("Failed to publish manager request to SNS: %s", exc)
         return json_response(
             500,
             {"error": "Failed to submit request. Please try again."},
@@ -202,16 +210,7 @@ def _publish_manager_request_to_sns(
 
 def _generate_ticket_id(session: Session) -> str:
     """Generate a unique progressive ticket ID in format R + 5 digits."""
-    result = session.execute(
-        sa_text(
-            "SELECT MAX(CAST(SUBSTRING(ticket_id FROM 2) AS BIGINT)) "
-            "FROM tickets "
-            "WHERE ticket_id LIKE 'R%'"
-        )
-    ).scalar()
-
-    next_number = (result or 0) + 1
-    return f"R{next_number:05d}"
+    return TicketRepository(session).next_ticket_id("R")
 
 
 def _serialize_ticket(ticket: Optional[Ticket]) -> Optional[dict[str, Any]]:
@@ -302,7 +301,7 @@ def _list_admin_tickets(event: Mapping[str, Any]) -> dict[str, Any]:
     with Session(get_engine()) as session:
         _set_session_audit_context(session, event)
         repo = TicketRepository(session)
-        cursor = _parse_cursor(_query_param(event, "cursor"))
+        cursor = _parse_created_cursor(_query_param(event, "cursor"))
         rows = repo.find_all(
             ticket_type=ticket_type,
             status=status,
@@ -311,7 +310,11 @@ def _list_admin_tickets(event: Mapping[str, Any]) -> dict[str, Any]:
         )
         has_more = len(rows) > limit
         trimmed = list(rows)[:limit]
-        next_cursor = _encode_cursor(trimmed[-1].id) if has_more and trimmed else None
+        next_cursor = (
+            _encode_created_cursor(trimmed[-1].created_at, trimmed[-1].id)
+            if has_more and trimmed
+            else None
+        )
 
         pending_count = repo.count_pending(ticket_type=ticket_type)
 
@@ -331,6 +334,7 @@ def _review_ticket(
     ticket_id_param: str,
 ) -> dict[str, Any]:
     """Approve or reject a ticket."""
+    ticket_uuid = _parse_uuid(ticket_id_param)
     body = _parse_body(event)
     action = body.get("action")
     admin_notes = body.get("admin_notes") or body.get("message", "")
@@ -345,10 +349,13 @@ def _review_ticket(
     if not reviewer_sub:
         return json_response(401, {"error": "User identity not found"}, event=event)
 
-    with Session(get_engine()) as session:
+    # Keep loaded state after commit so the response needs no re-SELECT.
+    with Session(get_engine(), expire_on_commit=False) as session:
         _set_session_audit_context(session, event)
         repo = TicketRepository(session)
-        ticket = repo.get_by_id(_parse_uuid(ticket_id_param))
+        # Lock the ticket so a concurrent review waits here and then sees
+        # the decided status, instead of repeating the approval side effects.
+        ticket = repo.get_by_id(ticket_uuid, for_update=True)
 
         if ticket is None:
             raise NotFoundError("ticket", ticket_id_param)
@@ -360,48 +367,89 @@ def _review_ticket(
                 event=event,
             )
 
-        organization = None
-        feedback_star_delta = 0
-
+        approval = TicketApproval()
         if action == "approve":
-            organization, feedback_star_delta = apply_ticket_approval(
+            approval = apply_ticket_approval(
                 session,
                 ticket,
                 body,
                 reviewer_sub,
             )
+        organization = approval.organization
 
         new_status = (
             TicketStatus.APPROVED if action == "approve" else TicketStatus.REJECTED
         )
-        ticket.status = new_status
-        ticket.reviewed_at = datetime.now(timezone.utc)
-        ticket.reviewed_by = reviewer_sub
-        ticket.admin_notes = admin_notes
-
-        repo.update(ticket)
+        reviewed = repo.review_pending(
+            ticket.id,
+            new_status,
+            datetime.now(timezone.utc),
+            reviewer_sub,
+            admin_notes,
+        )
+        if reviewed is None:
+            session.rollback()
+            return json_response(
+                409,
+                {"error": "Ticket has already been reviewed"},
+                event=event,
+            )
         session.commit()
-        session.refresh(ticket)
 
-        if organization:
-            session.refresh(organization)
+    # The decision is committed; the session is closed before any AWS call
+    # so its pooled connection is not held across network round trips.
+    logger.info("Ticket %s %sd by %s", ticket_id_param, action, reviewer_sub)
+
+    # Cognito and SNS calls are independent of each other and best
+    # effort, so run them concurrently once the decision is committed.
+    side_effects: list[Callable[[], None]] = [
+        partial(_publish_ticket_decision, ticket, action, admin_notes)
+    ]
+    if approval.new_manager_sub:
+        side_effects.append(
+            partial(_add_user_to_manager_group, approval.new_manager_sub)
+        )
+    if approval.feedback_star_delta and ticket.submitter_id:
+        side_effects.append(
+            partial(
+                safe_adjust_feedback_stars,
+                ticket.submitter_id,
+                approval.feedback_star_delta,
+            )
+        )
+    _run_parallel(side_effects)
 
-        if feedback_star_delta and ticket.submitter_id:
-            safe_adjust_feedback_stars(ticket.submitter_id, feedback_star_delta)
+    response_data: dict[str, Any] = {
+        "message": f"Ticket has been {action}d",
+        "ticket": _serialize_ticket(ticket),
+    }
 
-        logger.info(f"Ticket {ticket_id_param} {action}d by {reviewer_sub}")
+    if organization:
+        response_data["organization"] = {
+            "id": str(organization.id),
+            "name": organization.name,
+        }
 
-        _send_ticket_decision_email(ticket, action, admin_notes)
+    return json_response(200, response_data, event=event)
 
-        response_data: dict[str, Any] = {
-            "message": f"Ticket has been {action}d",
-            "ticket": _serialize_ticket(ticket),
-        }
 
-        if organization:
-            response_data["organization"] = {
-                "id": str(organization.id),
-                "name": organization.name,
-            }
+def _run_parallel(tasks: Sequence[Callable[[], None]]) -> None:
+    """Run independent best-effort tasks concurrently and wait for all.
 
-        return json_response(200, response_data, event=event)
+    Each task runs in a copy of the current context so request logging
+    fields carry over. Failures are logged and never raised.
+    """
+    if len(tasks) == 1:
+        try:
+            tasks[0]()
+        except Exception as exc:
+            logger.error("Ticket review side effect failed: %s", exc)
+        return
+    futures = [
+        _SIDE_EFFECT_EXECUTOR.submit(contextvars.copy_context().run, task)
+        for task in tasks
+    ]
+    for future in as_completed(futures):
+        exc = future.exception()
+        if exc is not None:
+            logger.error("Ticket review side effect failed: %s", exc)
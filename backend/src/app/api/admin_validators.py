@@ -5,9 +5,8 @@ from __future__ import annotations
 import re
 from functools import lru_cache
 from typing import Any, Optional
-from urllib.parse import urlparse
-from uuid import UUID
 
+from app.api.admin_request import _uuid_from_str
 from app.exceptions import ValidationError
 
 # --- Security validation functions ---
@@ -66,6 +65,13 @@ SOCIAL_FIELDS = (
 
 EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 SOCIAL_HANDLE_RE = re.compile(r"^@?[A-Za-z0-9][A-Za-z0-9._-]{0,63}$")
+_PHONE_SEPARATORS_RE = re.compile(r"[\s-]+")
+# Canonical (lowercase, hyphenated) UUID text, as Cognito issues user subs.
+_CANONICAL_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+# Scheme and authority of an http(s) URL, matched in one pass.
+_HTTP_URL_RE = re.compile(r"(?i)(https?):(?://([^/?#]*))?", re.ASCII)
 
 
 @lru_cache(maxsize=1)
@@ -88,13 +94,8 @@ def _validate_string_length(
     required: bool = False,
 ) -> Optional[str]:
     """Validate and sanitize a string input."""
-    if value is None:
-        if required:
-            raise ValidationError(f"{field_name} is required", field=field_name)
-        return None
-    if not isinstance(value, str):
-        value = str(value)
-    value = value.strip()
+    if value is not None:
+        value = (value if isinstance(value, str) else str(value)).strip()
     if not value:
         if required:
             raise ValidationError(f"{field_name} is required", field=field_name)
@@ -117,13 +118,13 @@ def _validate_url(url: str, field_name: str = "url") -> str:
             f"{field_name} must be at most {MAX_URL_LENGTH} characters",
             field=field_name,
         )
-    parsed = urlparse(url)
-    if parsed.scheme not in {"http", "https"}:
+    match = _HTTP_URL_RE.match(url)
+    if match is None:
         raise ValidationError(
             f"{field_name} must use http or https scheme",
             field=field_name,
         )
-    if not parsed.netloc:
+    if not match.group(2):
         raise ValidationError(
             f"{field_name} must have a valid domain", field=field_name
         )
@@ -132,16 +133,14 @@ def _validate_url(url: str, field_name: str = "url") -> str:
 
 def _validate_media_urls(urls: list[str]) -> list[str]:
     """Validate media URL list."""
-    cleaned = [str(url).strip() for url in urls if str(url).strip()]
+    cleaned = [text for url in urls if (text := str(url).strip())]
     if len(cleaned) > MAX_MEDIA_URLS_COUNT:
         raise ValidationError(
             f"media_urls cannot have more than {MAX_MEDIA_URLS_COUNT} items",
             field="media_urls",
         )
-    validated: list[str] = []
-    for url in cleaned:
-        validated.append(_validate_url(url, "media_urls"))
-    return sorted(validated)
+    # The list is stored sorted, so a set drops repeats without losing order.
+    return sorted({_validate_url(url, "media_urls") for url in cleaned})
 
 
 def _validate_logo_media_url(
@@ -259,7 +258,7 @@ def _validate_phone_fields(
     if not isinstance(phone_number, str):
         raise ValidationError("phone_number must be a string", field="phone_number")
     number = phone_number.strip()
-    normalized_number = re.sub(r"[\s-]+", "", number)
+    normalized_number = _PHONE_SEPARATORS_RE.sub("", number)
     if not number:
         raise ValidationError("phone_number is required", field="phone_number")
     if len(normalized_number) > MAX_PHONE_NUMBER_LENGTH:
@@ -294,11 +293,15 @@ def _validate_currency(currency: str) -> str:
     if not currency:
         return "HKD"
 
+    valid_currencies = _valid_currencies()
+    # Canonical input (the common case) skips the strip/upper copies.
+    if isinstance(currency, str) and currency in valid_currencies:
+        return currency
     if not isinstance(currency, str):
         currency = str(currency)
     currency = currency.strip().upper()
 
-    if currency not in _valid_currencies():
+    if currency not in valid_currencies:
         raise ValidationError(
             "currency must be a valid ISO 4217 code (e.g., HKD, USD, EUR)",
             field="currency",
@@ -322,8 +325,10 @@ def _validate_manager_id(manager_id: Any, required: bool = False) -> Optional[st
             raise ValidationError("manager_id is required", field="manager_id")
         return None
 
+    if _CANONICAL_UUID_RE.fullmatch(manager_id):
+        return manager_id
     try:
-        parsed = UUID(manager_id)
+        parsed = _uuid_from_str(manager_id)
         return str(parsed)
     except (ValueError, TypeError) as exc:
         raise ValidationError(
@@ -337,6 +342,8 @@ def _validate_language_code(code: str, field_name: str = "language") -> str:
     if not code:
         raise ValidationError(f"{field_name} cannot be empty", field=field_name)
 
+    if isinstance(code, str) and code in VALID_LANGUAGE_CODES:
+        return code
     if not isinstance(code, str):
         code = str(code)
     code = code.strip().lower()
@@ -360,15 +367,14 @@ def _validate_languages(languages: list[str]) -> list[str]:
             f"languages cannot have more than {MAX_LANGUAGES_COUNT} items",
             field="languages",
         )
-    validated: list[str] = []
-    seen = set()
-    for i, lang in enumerate(languages):
-        if lang and str(lang).strip():
-            code = _validate_language_code(str(lang).strip(), f"languages[{i}]")
-            if code not in seen:
-                validated.append(code)
-                seen.add(code)
-    return validated
+    # dict.fromkeys drops duplicates while keeping first-seen order.
+    return list(
+        dict.fromkeys(
+            _validate_language_code(text, f"languages[{i}]")
+            for i, lang in enumerate(languages)
+            if lang and (text := str(lang).strip())
+        )
+    )
 
 
 def _validate_translations_map(
@@ -406,16 +412,16 @@ def _parse_languages(value: Any) -> list[str]:
     if value is None:
         return []
     if isinstance(value, list):
-        languages = [str(item) for item in value if item]
-    elif isinstance(value, str):
-        languages = [item.strip() for item in value.split(",") if item.strip()]
-    else:
-        raise ValidationError(
-            "languages must be a list or comma-separated string",
-            field="languages",
+        # Drop empty items before _validate_languages applies the item limit.
+        return _validate_languages([str(item) for item in value if item])
+    if isinstance(value, str):
+        return _validate_languages(
+            [text for item in value.split(",") if (text := item.strip())]
         )
-
-    return _validate_languages(languages)
+    raise ValidationError(
+        "languages must be a list or comma-separated string",
+        field="languages",
+    )
 
 
 def _parse_media_urls(value: Any) -> list[str]:
@@ -423,9 +429,9 @@ def _parse_media_urls(value: Any) -> list[str]:
     if value is None:
         return []
     if isinstance(value, list):
-        return [str(item).strip() for item in value if str(item).strip()]
+        return [text for item in value if (text := str(item).strip())]
     if isinstance(value, str):
-        return [item.strip() for item in value.split(",") if item.strip()]
+        return [text for item in value.split(",") if (text := item.strip())]
     raise ValidationError(
         "media_urls must be a list or comma-separated string",
         field="media_urls",
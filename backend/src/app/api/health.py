@@ -15,6 +15,9 @@ from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.db.engine import get_engine
+from app.utils.responses import json_response
+
 
 @dataclass
 class HealthCheck:
@@ -89,8 +92,6 @@ def _check_database() -> HealthCheck:
     start_time = time.perf_counter()
 
     try:
-        from app.db.engine import get_engine
-
         engine = get_engine(use_cache=True)
         with Session(engine) as session:
             result = session.execute(text("SELECT 1"))
@@ -156,8 +157,6 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     Returns:
         API Gateway response with health status.
     """
-    from app.utils.responses import json_response
-
     # Check if detailed info is requested (only for internal calls)
     include_details = (event.get("queryStringParameters", {}) or {}).get(
         "details"
@@ -7,11 +7,11 @@ using shared utilities and centralized database management.
 from __future__ import annotations
 
 import base64
-import json
 from dataclasses import replace
-from typing import Any, Mapping
+from typing import Any, Final, Mapping
 from uuid import UUID
 
+import orjson
 from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
 
@@ -43,6 +43,10 @@ from app.db.queries import (
 )
 from app.api.search_validation import validate_search_query_params
 from app.exceptions import CursorError, ValidationError
+from app.services.staging_search_store import (
+    fetch_staging_search_response,
+    staging_search_data_enabled,
+)
 from app.utils import json_response, parse_decimal, parse_enum, parse_int
 from app.utils.logging import configure_logging, get_logger, set_request_context
 from app.utils.parsers import (
@@ -51,13 +55,16 @@ from app.utils.parsers import (
     parse_languages,
     parse_uuid_list,
 )
-from app.utils.responses import get_cors_headers, get_security_headers
+from app.utils.responses import dumps_json, get_cors_headers, get_security_headers
 from app.utils.translations import build_translation_map
 
 # Configure logging on module load
 configure_logging()
 logger = get_logger(__name__)
 
+# Every cursor we issue is well under this; longer input is rejected unparsed.
+_MAX_CURSOR_LENGTH: Final[int] = 256
+
 
 def lambda_handler(event: Mapping[str, Any], context: Any) -> dict[str, Any]:
     """Handle API Gateway request for search."""
@@ -71,7 +78,8 @@ def lambda_handler(event: Mapping[str, Any], context: Any) -> dict[str, Any]:
         logger.debug("Search filters parsed", extra={"filters": str(filters)})
         response = fetch_search_response(filters)
         logger.info(
-            f"Search completed: {len(response.items)} results",
+            "Search completed: %s results",
+            len(response.items),
             extra={
                 "count": len(response.items),
                 "has_more": response.next_cursor is not None,
@@ -79,13 +87,13 @@ def lambda_handler(event: Mapping[str, Any], context: Any) -> dict[str, Any]:
         )
         return _create_response(200, response, event)
     except (ValidationError, CursorError) as exc:
-        logger.warning(f"Validation error: {exc.message}")
+        logger.warning("Validation error: %s", exc.message)
         return json_response(exc.status_code, exc.to_dict(), event=event)
     except ValueError as exc:
-        logger.warning(f"Value error: {exc}")
+        logger.warning("Value error: %s", exc)
         return json_response(400, {"error": str(exc)}, event=event)
     except Exception as exc:  # pragma: no cover - safety net
-        logger.exception(f"Unexpected error in search: {type(exc).__name__}")
+        logger.exception("Unexpected error in search: %s", type(exc).__name__)
         return json_response(500, {"error": "Internal server error"}, event=event)
 
 
@@ -146,11 +154,6 @@ def fetch_search_response(
 ) -> ActivitySearchResponseSchema:
     """Fetch search response from the database or staging fixture."""
 
-    from app.services.staging_search_store import (
-        fetch_staging_search_response,
-        staging_search_data_enabled,
-    )
-
     if staging_search_data_enabled():
         return fetch_staging_search_response(filters)
 
@@ -334,7 +337,7 @@ def _create_response(
     return {
         "statusCode": status_code,
         "headers": headers,
-        "body": json.dumps(payload, default=str),
+        "body": dumps_json(payload),
     }
 
 
@@ -363,13 +366,13 @@ def _encode_cursor(
     schedule_id: UUID,
 ) -> str:
     """Encode a pagination cursor."""
-    payload = json.dumps(
+    payload = orjson.dumps(
         {
             "schedule_id": str(schedule_id),
             "day_of_week_utc": day_of_week_utc,
             "start_minutes_utc": start_minutes_utc,
         }
-    ).encode("utf-8")
+    )
     encoded = base64.urlsafe_b64encode(payload).decode("utf-8")
     return encoded.rstrip("=")
 
@@ -377,6 +380,8 @@ def _encode_cursor(
 def _decode_cursor(cursor: str) -> dict[str, Any]:
     """Decode a pagination cursor."""
 
+    if len(cursor) > _MAX_CURSOR_LENGTH:
+        raise ValueError("Cursor too long")
     padding = "=" * (-len(cursor) % 4)
     raw = base64.urlsafe_b64decode(cursor + padding)
-    return json.loads(raw)
+    return orjson.loads(raw)
@@ -12,13 +12,13 @@ SECURITY NOTES:
 from __future__ import annotations
 
 import base64
-import json
 import os
 import time
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import jwt
+import orjson
 from jwt import PyJWKClient, PyJWKClientError
 
 from app.utils.logging import get_logger
@@ -60,9 +60,9 @@ def _extract_unverified_claims(token: str) -> dict[str, Any]:
         if padding != 4:
             payload += "=" * padding
 
-        decoded_bytes = base64.urlsafe_b64decode(payload)
-        return json.loads(decoded_bytes.decode("utf-8"))
-    except (ValueError, json.JSONDecodeError, UnicodeDecodeError) as exc:
+        # orjson validates UTF-8 itself, so the bytes are parsed directly.
+        return orjson.loads(base64.urlsafe_b64decode(payload))
+    except ValueError as exc:
         raise JWTValidationError(
             "Invalid JWT format: could not decode payload",
             reason="invalid_token",
@@ -232,13 +232,13 @@ def decode_and_verify_token(
         jwks_client = _get_jwks_client(user_pool_id, region)
         signing_key = jwks_client.get_signing_key_from_jwt(token)
     except PyJWKClientError as exc:
-        logger.warning(f"Failed to get signing key: {exc}")
+        logger.warning("Failed to get signing key: %s", exc)
         raise JWTValidationError(
             "Could not retrieve signing key",
             reason="invalid_token",
         ) from exc
     except (jwt.PyJWTError, TypeError, ValueError) as exc:
-        logger.warning(f"Unexpected error getting signing key: {exc}")
+        logger.warning("Unexpected error getting signing key: %s", exc)
         raise JWTValidationError(
             "Error retrieving signing key",
             reason="invalid_token",
@@ -288,7 +288,7 @@ def decode_and_verify_token(
             reason="invalid_token",
         ) from exc
     except jwt.PyJWTError as exc:
-        logger.warning(f"Unexpected error during token verification: {exc}")
+        logger.warning("Unexpected error during token verification: %s", exc)
         raise JWTValidationError(
             "Token verification failed",
             reason="invalid_token",
@@ -29,13 +29,16 @@ Usage:
 
 from __future__ import annotations
 
+import enum
 from datetime import datetime
 from datetime import timezone
+from decimal import Decimal
 from typing import Any
 from typing import Optional
 from typing import Sequence
 from uuid import UUID
 
+from sqlalchemy import func
 from sqlalchemy import select
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -438,8 +441,6 @@ class AuditLogRepository:
         Returns:
             Dictionary mapping action to count.
         """
-        from sqlalchemy import func
-
         query = (
             select(AuditLog.action, func.count(AuditLog.id))
             .where(AuditLog.table_name == table_name)
@@ -467,10 +468,6 @@ def serialize_for_audit(
     Returns:
         Dictionary of serialized values.
     """
-    import enum
-    from decimal import Decimal
-    from uuid import UUID as UUIDType
-
     exclude = exclude_fields or set()
     result: dict[str, Any] = {}
 
@@ -484,7 +481,7 @@ def serialize_for_audit(
         # Handle special types
         if value is None:
             result[column.name] = None
-        elif isinstance(value, UUIDType):
+        elif isinstance(value, UUID):
             result[column.name] = str(value)
         elif isinstance(value, datetime):
             result[column.name] = value.isoformat()
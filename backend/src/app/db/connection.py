@@ -44,7 +44,7 @@ def get_database_url() -> str:
         raise RuntimeError("Password is required for non-IAM authentication")
 
     if use_iam_auth:
-        token = _generate_iam_token(host, int(port), str(username))
+        token = generate_iam_token(host, int(port), str(username))
         return (
             "postgresql+psycopg://"
             f"{quote_plus(str(username))}:{quote_plus(token)}"
@@ -64,7 +64,7 @@ def _use_iam_auth() -> bool:
     return str(os.getenv("DATABASE_IAM_AUTH", "")).lower() in {"1", "true", "yes"}
 
 
-def _generate_iam_token(host: str, port: int, username: str) -> str:
+def generate_iam_token(host: str, port: int, username: str) -> str:
     """Generate an IAM auth token for RDS Proxy."""
 
     region = os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
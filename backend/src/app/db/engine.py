@@ -10,11 +10,11 @@ import os
 from typing import Any
 from typing import Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.pool import NullPool
 
-from app.db.connection import get_database_url
+from app.db.connection import generate_iam_token, get_database_url
 
 # Module-level engine cache for connection reuse across Lambda invocations
 _ENGINE_CACHE: dict[str, Engine] = {}
@@ -26,30 +26,26 @@ def get_engine(
 ) -> Engine:
     """Get or create a SQLAlchemy engine.
 
-    For IAM authentication, a new engine is always created since
-    auth tokens expire. For password authentication, the engine
-    is cached and reused across invocations.
+    The engine is cached and reused across invocations so warm Lambda
+    containers keep their pooled connection. With IAM authentication a
+    fresh auth token is generated for every new DBAPI connection, so an
+    expired token never outlives the engine.
 
     Args:
-        use_cache: Whether to use the engine cache (ignored for IAM auth).
+        use_cache: Whether to use the engine cache.
         pool_class: Override the connection pool class.
 
     Returns:
         A configured SQLAlchemy engine.
     """
-    use_iam_auth = _use_iam_auth()
-
-    # IAM auth tokens expire, so don't cache the engine
-    if use_iam_auth:
-        use_cache = False
-        pool_class = NullPool
-
     cache_key = "default"
-    if use_cache and cache_key in _ENGINE_CACHE:
-        return _ENGINE_CACHE[cache_key]
+    if use_cache:
+        cached = _ENGINE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
     database_url = get_database_url()
-    pool_settings = _get_pool_settings(use_iam_auth, pool_class)
+    pool_settings = _get_pool_settings(pool_class)
 
     engine = create_engine(
         database_url,
@@ -58,6 +54,9 @@ def get_engine(
         **pool_settings,
     )
 
+    if _use_iam_auth():
+        event.listen(engine, "do_connect", _refresh_iam_token)
+
     if use_cache:
         _ENGINE_CACHE[cache_key] = engine
 
@@ -83,24 +82,36 @@ def _get_connect_args() -> dict[str, str]:
     return {"sslmode": sslmode}
 
 
-def _get_pool_settings(
-    use_iam_auth: bool,
-    pool_class: Optional[type],
-) -> dict[str, Any]:
+def _refresh_iam_token(
+    dialect: Any,
+    conn_rec: Any,
+    cargs: tuple[Any, ...],
+    cparams: dict[str, Any],
+) -> None:
+    """Replace the connection password with a freshly generated IAM token."""
+    cparams["password"] = generate_iam_token(
+        str(cparams["host"]),
+        int(cparams.get("port") or 5432),
+        str(cparams["user"]),
+    )
+
+
+def _get_pool_settings(pool_class: Optional[type]) -> dict[str, Any]:
     """Return connection pool settings tuned for Lambda.
 
-    For IAM auth or when NullPool is specified, disable pooling.
-    Otherwise, use minimal pool settings suitable for Lambda's
-    execution model.
+    A Lambda container serves one request at a time, so a single pooled
+    connection is kept open between invocations. RDS Proxy multiplexes
+    these client connections onto its own pool, and pre-ping plus a short
+    recycle window drop connections the proxy has closed while idle.
+    Passing NullPool disables pooling.
 
     Args:
-        use_iam_auth: Whether IAM authentication is being used.
         pool_class: Optional pool class override.
 
     Returns:
         Dictionary of pool configuration options.
     """
-    if use_iam_auth or pool_class == NullPool:
+    if pool_class == NullPool:
         return {"poolclass": NullPool}
 
     return {
@@ -7,6 +7,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional
 
 import sqlalchemy as sa
+from psycopg.types.range import Range
 from sqlalchemy import (
     CheckConstraint,
     ForeignKey,
@@ -34,6 +35,7 @@ class Activity(Base):
     """Activity offered by an organization."""
 
     __tablename__ = "activities"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
@@ -67,7 +69,7 @@ class Activity(Base):
         server_default=text("'{}'::jsonb"),
         comment="Language map for non-English description translations",
     )
-    age_range: Mapped[object] = mapped_column(INT4RANGE(), nullable=False)
+    age_range: Mapped[Range[int]] = mapped_column(INT4RANGE(), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         nullable=False,
@@ -119,6 +121,7 @@ class ActivityPricing(Base):
     """Pricing for an activity at a specific location."""
 
     __tablename__ = "activity_pricing"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
@@ -169,6 +172,7 @@ class ActivitySchedule(Base):
     """Schedule definition for an activity at a location."""
 
     __tablename__ = "activity_schedule"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
@@ -214,9 +218,13 @@ class ActivitySchedule(Base):
 
     activity: Mapped["Activity"] = relationship(back_populates="schedules")
     location: Mapped["Location"] = relationship(back_populates="activity_schedules")
+    # Every reader of a schedule (serializer, validation, export) walks its
+    # entries, so load them for all schedules of a result in one IN query
+    # rather than one lazy SELECT per schedule.
     entries: Mapped[List["ActivityScheduleEntry"]] = relationship(
         back_populates="schedule",
         cascade="all, delete-orphan",
+        lazy="selectin",
         order_by=(
             "ActivityScheduleEntry.day_of_week_utc, "
             "ActivityScheduleEntry.start_minutes_utc, "
@@ -229,6 +237,7 @@ class ActivityScheduleEntry(Base):
     """Weekly schedule entry for a schedule definition."""
 
     __tablename__ = "activity_schedule_entries"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
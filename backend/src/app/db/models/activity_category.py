@@ -18,6 +18,7 @@ class ActivityCategory(Base):
     """Hierarchical activity category."""
 
     __tablename__ = "activity_categories"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
@@ -16,6 +16,7 @@ class FeedbackLabel(Base):
     """Predefined label for organization feedback."""
 
     __tablename__ = "feedback_labels"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
@@ -23,6 +23,7 @@ class Location(Base):
     """Location for an organization."""
 
     __tablename__ = "locations"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
@@ -21,6 +21,9 @@ class Organization(Base):
     """Organization that provides activities."""
 
     __tablename__ = "organizations"
+    # Fetch server-generated columns (id, timestamps, defaults) in the
+    # INSERT's RETURNING clause instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
@@ -18,6 +18,7 @@ class OrganizationFeedback(Base):
     """Approved feedback for an organization."""
 
     __tablename__ = "organization_feedback"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
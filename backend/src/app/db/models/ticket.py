@@ -20,6 +20,7 @@ class Ticket(Base):
     """Ticket submitted by a user for admin review."""
 
     __tablename__ = "tickets"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=True),
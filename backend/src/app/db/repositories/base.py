@@ -13,7 +13,7 @@ from typing import Type
 from typing import TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.db.base import Base
@@ -46,15 +46,19 @@ class BaseRepository(Generic[T]):
         """Get the current session."""
         return self._session
 
-    def get_by_id(self, entity_id: UUID) -> Optional[T]:
+    def get_by_id(self, entity_id: UUID, for_update: bool = False) -> Optional[T]:
         """Get an entity by its primary key.
 
         Args:
             entity_id: The UUID primary key.
+            for_update: Lock the row with SELECT ... FOR UPDATE until the
+                transaction ends.
 
         Returns:
             The entity if found, None otherwise.
         """
+        if for_update:
+            return self._session.get(self._model, entity_id, with_for_update=True)
         return self._session.get(self._model, entity_id)
 
     def get_all(
@@ -90,6 +94,9 @@ class BaseRepository(Generic[T]):
     def create(self, entity: T) -> T:
         """Create a new entity.
 
+        Models with server defaults set eager_defaults, so the INSERT
+        returns the generated columns and no refresh query is needed.
+
         Args:
             entity: The entity to create.
 
@@ -98,12 +105,14 @@ class BaseRepository(Generic[T]):
         """
         self._session.add(entity)
         self._session.flush()
-        self._session.refresh(entity)
         return entity
 
     def update(self, entity: T) -> T:
         """Update an existing entity.
 
+        No columns are rewritten server-side on UPDATE, so the flushed
+        in-memory state is already current and no refresh query is issued.
+
         Args:
             entity: The entity to update.
 
@@ -112,7 +121,6 @@ class BaseRepository(Generic[T]):
         """
         self._session.add(entity)
         self._session.flush()
-        self._session.refresh(entity)
         return entity
 
     def delete(self, entity: T) -> None:
@@ -145,7 +153,5 @@ class BaseRepository(Generic[T]):
         Returns:
             Total number of entities.
         """
-        from sqlalchemy import func
-
         result = self._session.execute(select(func.count()).select_from(self._model))
         return result.scalar() or 0
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from typing import Optional, Sequence
+from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
 from app.db.models import Organization
@@ -65,6 +66,64 @@ class OrganizationRepository(BaseRepository[Organization]):
         )
         return self._session.execute(query).scalars().all()
 
+    def find_ids_by_manager(self, manager_id: str) -> Sequence[UUID]:
+        """Return the IDs of all organizations managed by a Cognito user.
+
+        Only the id column is selected, for authorization checks that do
+        not need the rows themselves.
+
+        Args:
+            manager_id: The Cognito user sub (subject) identifier.
+
+        Returns:
+            IDs of the organizations managed by the specified user.
+        """
+        query = select(Organization.id).where(Organization.manager_id == manager_id)
+        return self._session.execute(query).scalars().all()
+
+    def assign_manager(
+        self,
+        organization_id: UUID,
+        manager_id: str,
+    ) -> Optional[Organization]:
+        """Set an organization's manager with a single UPDATE ... RETURNING.
+
+        Args:
+            organization_id: The organization UUID.
+            manager_id: Cognito user sub of the new manager.
+
+        Returns:
+            The updated organization, or None if it does not exist.
+        """
+        query = (
+            update(Organization)
+            .where(Organization.id == organization_id)
+            .values(manager_id=manager_id)
+            .returning(Organization)
+            .execution_options(populate_existing=True)
+        )
+        return self._session.execute(query).scalar_one_or_none()
+
+    def transfer_manager(self, from_manager_id: str, to_manager_id: str) -> int:
+        """Reassign every organization of one manager to another.
+
+        Runs as a single UPDATE statement.
+
+        Args:
+            from_manager_id: Cognito user sub of the current manager.
+            to_manager_id: Cognito user sub of the new manager.
+
+        Returns:
+            Number of organizations transferred.
+        """
+        result = self._session.execute(
+            update(Organization)
+            .where(Organization.manager_id == from_manager_id)
+            .values(manager_id=to_manager_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
+
     def search_by_name(
         self,
         name_pattern: str,
@@ -5,16 +5,24 @@ This module provides data access methods for the tickets table.
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Optional
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text, tuple_, update
 from sqlalchemy.orm import Session
 
 from app.db.models import Ticket, TicketStatus, TicketType
 from app.db.repositories.base import BaseRepository
 
+# Postgres sequences backing progressive ticket IDs, keyed by ID prefix.
+TICKET_ID_SEQUENCES = {
+    "R": "ticket_id_access_request_seq",
+    "S": "ticket_id_suggestion_seq",
+    "F": "ticket_id_feedback_seq",
+}
+
 
 class TicketRepository(BaseRepository[Ticket]):
     """Repository for unified ticket operations."""
@@ -44,6 +52,79 @@ class TicketRepository(BaseRepository[Ticket]):
         query = select(Ticket).where(Ticket.ticket_id == ticket_id)
         return self._session.execute(query).scalar_one_or_none()
 
+    def find_by_ticket_ids(
+        self,
+        ticket_ids: Sequence[str],
+    ) -> Sequence[Ticket]:
+        """Find tickets by their ticket IDs in one query.
+
+        Args:
+            ticket_ids: Ticket IDs to load.
+
+        Returns:
+            The tickets that exist, in no particular order.
+        """
+        if not ticket_ids:
+            return []
+        query = select(Ticket).where(Ticket.ticket_id.in_(ticket_ids))
+        return self._session.execute(query).scalars().all()
+
+    def next_ticket_id(self, prefix: str) -> str:
+        """Allocate the next progressive ticket ID for a prefix.
+
+        Uses a database sequence, so allocation is atomic and does not
+        scan existing tickets.
+
+        Args:
+            prefix: Ticket ID prefix (R, S or F).
+
+        Returns:
+            The ticket ID, e.g. R00042.
+        """
+        sequence_name = TICKET_ID_SEQUENCES[prefix]
+        next_number = self._session.execute(
+            text(f"SELECT nextval('{sequence_name}')")
+        ).scalar_one()
+        return f"{prefix}{next_number:05d}"
+
+    def review_pending(
+        self,
+        ticket_id: UUID,
+        status: TicketStatus,
+        reviewed_at: datetime,
+        reviewed_by: str,
+        admin_notes: Optional[str],
+    ) -> Optional[Ticket]:
+        """Record a review decision on a pending ticket.
+
+        Runs a single UPDATE ... RETURNING guarded on the pending status, so
+        the reviewed row is loaded without a follow-up SELECT and a ticket
+        reviewed concurrently is not overwritten.
+
+        Args:
+            ticket_id: The ticket UUID.
+            status: The decision status to set.
+            reviewed_at: When the review happened.
+            reviewed_by: Cognito user sub of the reviewer.
+            admin_notes: Optional notes for the submitter.
+
+        Returns:
+            The updated ticket, or None if it was no longer pending.
+        """
+        query = (
+            update(Ticket)
+            .where(Ticket.id == ticket_id, Ticket.status == TicketStatus.PENDING)
+            .values(
+                status=status,
+                reviewed_at=reviewed_at,
+                reviewed_by=reviewed_by,
+                admin_notes=admin_notes,
+            )
+            .returning(Ticket)
+            .execution_options(populate_existing=True)
+        )
+        return self._session.execute(query).scalar_one_or_none()
+
     def find_pending_by_submitter(
         self,
         submitter_id: str,
@@ -102,26 +183,29 @@ class TicketRepository(BaseRepository[Ticket]):
         ticket_type: Optional[TicketType] = None,
         status: Optional[TicketStatus] = None,
         limit: int = 50,
-        cursor: Optional[UUID] = None,
+        cursor: Optional[tuple[datetime, UUID]] = None,
     ) -> Sequence[Ticket]:
-        """Find all tickets with optional filters.
+        """Find all tickets with optional filters, newest first.
+
+        Uses keyset pagination on (created_at, id), so each page is an
+        index seek regardless of depth.
 
         Args:
             ticket_type: Filter by ticket type.
             status: Filter by ticket status.
             limit: Maximum number of results.
-            cursor: Pagination cursor.
+            cursor: (created_at, id) of the last ticket on the previous page.
 
         Returns:
             Sequence of tickets.
         """
-        query = select(Ticket).order_by(Ticket.created_at.desc())
+        query = select(Ticket).order_by(Ticket.created_at.desc(), Ticket.id.desc())
         if ticket_type:
             query = query.where(Ticket.ticket_type == ticket_type)
         if status:
             query = query.where(Ticket.status == status)
         if cursor:
-            query = query.where(Ticket.id > cursor)
+            query = query.where(tuple_(Ticket.created_at, Ticket.id) < tuple_(*cursor))
         return self._session.execute(query.limit(limit)).scalars().all()
 
     def count_pending(
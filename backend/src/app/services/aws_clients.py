@@ -2,23 +2,39 @@
 
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import boto3
+from botocore.config import Config
 
 _CLIENT_CACHE: dict[tuple[str, str | None], Any] = {}
+# boto3's default session is not thread-safe for client creation.
+_CLIENT_LOCK = threading.Lock()
+
+# Shared by all clients so warm containers reuse one connection pool per
+# service and retry throttling consistently.
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
 
 
 def get_client(service: str, region_name: str | None = None) -> Any:
     """Return a cached boto3 client for the given service."""
     cache_key = (service, region_name)
-    if cache_key in _CLIENT_CACHE:
-        return _CLIENT_CACHE[cache_key]
-    client = boto3.client(  # type: ignore[call-overload]
-        service,
-        region_name=region_name,
-    )
-    _CLIENT_CACHE[cache_key] = client
+    client = _CLIENT_CACHE.get(cache_key)
+    if client is not None:
+        return client
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(cache_key)
+        if client is None:
+            client = boto3.client(  # type: ignore[call-overload]
+                service,
+                region_name=region_name,
+                config=CLIENT_CONFIG,
+            )
+            _CLIENT_CACHE[cache_key] = client
     return client
 
 
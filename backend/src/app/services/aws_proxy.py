@@ -25,11 +25,11 @@ Environment (proxy Lambda):
 
 from __future__ import annotations
 
-import json
 import os
 from typing import Any, Mapping, Optional
 from urllib.parse import urlparse
 
+import orjson
 from botocore.exceptions import BotoCoreError, ClientError
 
 from app.services.aws_clients import get_client
@@ -88,7 +88,7 @@ def _handle_aws(event: Mapping[str, Any]) -> dict[str, Any]:
     allowed = _get_allowed_actions()
 
     if key not in allowed:
-        logger.warning(f"Blocked disallowed AWS action: {key}")
+        logger.warning("Blocked disallowed AWS action: %s", key)
         return {
             "error": {
                 "code": "ActionNotAllowed",
@@ -96,7 +96,7 @@ def _handle_aws(event: Mapping[str, Any]) -> dict[str, Any]:
             },
         }
 
-    logger.info(f"Proxying AWS {key}")
+    logger.info("Proxying AWS %s", key)
 
     try:
         client = get_client(service)  # type: ignore[call-overload]
@@ -110,7 +110,12 @@ def _handle_aws(event: Mapping[str, Any]) -> dict[str, Any]:
             }
         result = method(**params)
         result.pop("ResponseMetadata", None)
-        return {"result": json.loads(json.dumps(result, default=str))}
+        # Round-trip through JSON so datetimes and other boto3 types come
+        # back as str(), the form callers of ``invoke`` have always seen.
+        normalized = orjson.dumps(
+            result, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        return {"result": orjson.loads(normalized)}
     except (ClientError, BotoCoreError, TypeError, ValueError) as exc:
         code = (
             getattr(exc, "response", {})
@@ -118,7 +123,7 @@ def _handle_aws(event: Mapping[str, Any]) -> dict[str, Any]:
             .get("Code", type(exc).__name__)
         )
         message = str(exc)
-        logger.warning(f"Proxy AWS call {key} failed: {code}: {message}")
+        logger.warning("Proxy AWS call %s failed: %s: %s", key, code, message)
         return {"error": {"code": code, "message": message}}
     except Exception as exc:
         logger.exception("Unexpected proxy AWS handler error")
@@ -171,7 +176,7 @@ def _handle_http(event: Mapping[str, Any]) -> dict[str, Any]:
     # Check against allow-list
     allowed_prefixes = _get_allowed_http_urls()
     if not any(url.startswith(prefix) for prefix in allowed_prefixes):
-        logger.warning(f"Blocked disallowed HTTP URL: {url}")
+        logger.warning("Blocked disallowed HTTP URL: %s", url)
         return {
             "error": {
                 "code": "URLNotAllowed",
@@ -179,7 +184,7 @@ def _handle_http(event: Mapping[str, Any]) -> dict[str, Any]:
             },
         }
 
-    logger.info(f"Proxying HTTP {method} {url}")
+    logger.info("Proxying HTTP %s %s", method, url)
 
     try:
         encoded_body = body.encode("utf-8") if body else None
@@ -213,7 +218,7 @@ def _handle_http(event: Mapping[str, Any]) -> dict[str, Any]:
             },
         }
     except (urllib.error.URLError, TimeoutError, OSError, ValueError) as exc:
-        logger.warning(f"HTTP request failed: {type(exc).__name__}: {exc}")
+        logger.warning("HTTP request failed: %s: %s", type(exc).__name__, exc)
         return {
             "error": {
                 "code": type(exc).__name__,
@@ -270,10 +275,10 @@ def _invoke_proxy(payload: dict[str, Any]) -> dict[str, Any]:
     resp = _get_lambda_client().invoke(
         FunctionName=_get_proxy_arn(),
         InvocationType="RequestResponse",
-        Payload=json.dumps(payload).encode(),
+        Payload=orjson.dumps(payload),
     )
 
-    body = json.loads(resp["Payload"].read())
+    body = orjson.loads(resp["Payload"].read())
 
     if resp.get("FunctionError"):
         raise AwsProxyError("LambdaInvocationError", str(body))
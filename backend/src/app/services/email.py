@@ -7,6 +7,9 @@ from typing import Any, Iterable, Optional
 
 from app.services.aws_clients import get_ses_client
 
+# SES accepts at most 50 destinations per bulk send.
+MAX_BULK_DESTINATIONS = 50
+
 
 def send_email(
     *,
@@ -45,3 +48,41 @@ def send_templated_email(
         Template=template_name,
         TemplateData=json.dumps(template_data),
     )
+
+
+def send_bulk_templated_email(
+    *,
+    source: str,
+    template_name: str,
+    destinations: Iterable[tuple[str, dict[str, Any]]],
+) -> None:
+    """Send one templated email per recipient via SES bulk sends.
+
+    Destinations are (address, template_data) pairs and are sent in chunks
+    of ``MAX_BULK_DESTINATIONS``. Per-recipient failures reported by SES
+    raise ValueError after all chunks have been attempted.
+    """
+    entries = [
+        {
+            "Destination": {"ToAddresses": [address]},
+            "ReplacementTemplateData": json.dumps(template_data),
+        }
+        for address, template_data in destinations
+    ]
+    failed: list[str] = []
+    client = get_ses_client()
+    for start in range(0, len(entries), MAX_BULK_DESTINATIONS):
+        chunk = entries[start : start + MAX_BULK_DESTINATIONS]
+        response = client.send_bulk_templated_email(
+            Source=source,
+            Template=template_name,
+            DefaultTemplateData="{}",
+            Destinations=chunk,
+        )
+        for status in response.get("Status", []):
+            if status.get("Status") != "Success":
+                failed.append(
+                    f"{status.get('Status')}: {status.get('Error', 'unknown error')}"
+                )
+    if failed:
+        raise ValueError(f"{len(failed)} bulk email(s) failed: {'; '.join(failed)}")
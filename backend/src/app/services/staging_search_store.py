@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import base64
 import json
 import os
 from decimal import Decimal
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid5
+
+import orjson
 
 from app.api.schemas import (
     ActivitySchema,
@@ -154,8 +157,6 @@ def _normalize_item(item: dict[str, Any]) -> dict[str, Any]:
 
 @lru_cache(maxsize=1)
 def _uuid_from_parts(activity_id: str, location_id: str, languages: str) -> str:
-    from uuid import uuid5
-
     namespace = UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
     return str(uuid5(namespace, f"{activity_id}:{location_id}:{languages}"))
 
@@ -206,12 +207,11 @@ def _matches(
         if pricing.get("pricing_type") != filters.pricing_type.value:
             return False
 
-    if filters.price_min is not None:
-        if Decimal(str(pricing.get("amount", 0))) < filters.price_min:
+    if filters.price_min is not None or filters.price_max is not None:
+        amount = Decimal(str(pricing.get("amount", 0)))
+        if filters.price_min is not None and amount < filters.price_min:
             return False
-
-    if filters.price_max is not None:
-        if Decimal(str(pricing.get("amount", 0))) > filters.price_max:
+        if filters.price_max is not None and amount > filters.price_max:
             return False
 
     if filters.schedule_type is not None:
@@ -342,14 +342,12 @@ def _encode_cursor(
     start_minutes_utc: int,
     schedule_id: UUID,
 ) -> str:
-    import base64
-
-    payload = json.dumps(
+    payload = orjson.dumps(
         {
             "schedule_id": str(schedule_id),
             "day_of_week_utc": day_of_week_utc,
             "start_minutes_utc": start_minutes_utc,
         }
-    ).encode("utf-8")
+    )
     encoded = base64.urlsafe_b64encode(payload).decode("utf-8")
     return encoded.rstrip("=")
@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import asdict
 from typing import Any
 from typing import Mapping
 from typing import Optional
 
+import orjson
 from pydantic import BaseModel
 
 from app.exceptions import ValidationError
 
+# Datetimes are passed through to default=str so they keep the format the
+# stdlib encoder produced; non-str keys are stringified as json.dumps did.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def dumps_json(payload: Any) -> str:
+    """Serialize a response payload to a JSON string.
+
+    Values JSON cannot represent natively (Decimal, datetime, ...) are
+    converted with str().
+    """
+    return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+
 
 def validate_content_type(
     event: Mapping[str, Any],
@@ -174,7 +187,7 @@ def json_response(
     return {
         "statusCode": status_code,
         "headers": response_headers,
-        "body": json.dumps(payload, default=str),
+        "body": dumps_json(payload),
     }
 
 
@@ -19,14 +19,9 @@ def build_translation_map(
     Returns:
         Language map that always includes English when base_value is present.
     """
-    result: dict[str, str] = {}
-    if base_value:
-        result["en"] = base_value
+    result: dict[str, str] = {"en": base_value} if base_value else {}
     if translations:
-        for key, value in translations.items():
-            if not value:
-                continue
-            if key == "en":
-                continue
-            result[key] = value
+        result.update(
+            {key: value for key, value in translations.items() if value and key != "en"}
+        )
     return result
@@ -0,0 +1,44 @@
+"""Tests for admin audit log handlers."""
+
+from __future__ import annotations
+
+import logging
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "backend" / "src"))
+
+from app.api import admin_audit  # noqa: E402
+
+
+def test_list_audit_logs_logs_formatted_result_count(monkeypatch, caplog) -> None:
+    """Ensure the result log fills its placeholders instead of a tuple repr."""
+
+    class FakeSession:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def __enter__(self) -> "FakeSession":
+            return self
+
+        def __exit__(self, *args) -> None:
+            return None
+
+    class FakeRepo:
+        def __init__(self, session) -> None:
+            pass
+
+        def get_recent_activity(self, **kwargs) -> list:
+            return []
+
+    monkeypatch.setattr(admin_audit, "Session", FakeSession)
+    monkeypatch.setattr(admin_audit, "get_engine", lambda: None)
+    monkeypatch.setattr(admin_audit, "_set_session_audit_context", lambda *a: None)
+    monkeypatch.setattr(admin_audit, "AuditLogRepository", FakeRepo)
+
+    with caplog.at_level(logging.INFO, logger=admin_audit.__name__):
+        response = admin_audit._list_audit_logs({"queryStringParameters": {}})
+
+    assert response["statusCode"] == 200
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Audit logs query returned 0 entries (has_more=False)" in messages
@@ -48,14 +48,113 @@ def test_is_admin_false_without_claims() -> None:
 def test_admin_cursor_roundtrip() -> None:
     """Ensure admin cursor roundtrip works."""
 
-    from app.api.admin import _decode_cursor
     from app.api.admin import _encode_cursor
     from app.api.admin import _parse_cursor
     from uuid import uuid4
 
     cursor_id = uuid4()
     cursor = _encode_cursor(cursor_id)
-    payload = _decode_cursor(cursor)
-    assert payload["id"] == str(cursor_id)
+    assert len(cursor) == 22
     parsed = _parse_cursor(cursor)
     assert parsed == cursor_id
+    assert _parse_cursor(_encode_cursor(str(cursor_id))) == cursor_id
+
+
+def test_admin_cursor_accepts_legacy_json_cursor() -> None:
+    """Ensure JSON cursors issued before the packed form still parse."""
+
+    import base64
+    from uuid import uuid4
+
+    from app.api.admin import _decode_cursor
+    from app.api.admin import _parse_cursor
+
+    cursor_id = uuid4()
+    legacy = base64.urlsafe_b64encode(
+        f'{{"id":"{cursor_id}"}}'.encode()
+    ).decode().rstrip("=")
+    assert _decode_cursor(legacy)["id"] == str(cursor_id)
+    assert _parse_cursor(legacy) == cursor_id
+
+
+def test_admin_created_cursor_roundtrip() -> None:
+    """Ensure the (created_at, id) keyset cursor roundtrip works."""
+
+    from datetime import datetime, timezone
+    from uuid import uuid4
+
+    from app.api.admin_request import _encode_created_cursor
+    from app.api.admin_request import _parse_created_cursor
+
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    cursor_id = uuid4()
+    cursor = _encode_created_cursor(created_at, cursor_id)
+    assert _parse_created_cursor(cursor) == (created_at, cursor_id)
+    assert _parse_created_cursor(None) is None
+
+
+def test_admin_created_cursor_rejects_id_only_cursor() -> None:
+    """Ensure an id-only cursor is rejected by the keyset parser."""
+
+    from uuid import uuid4
+
+    from app.api.admin_request import _encode_cursor
+    from app.api.admin_request import _parse_created_cursor
+    from app.exceptions import ValidationError
+
+    with pytest.raises(ValidationError):
+        _parse_created_cursor(_encode_cursor(uuid4()))
+
+
+def test_admin_created_cursor_rejects_out_of_range_timestamp() -> None:
+    """Ensure a crafted cursor outside the datetime range is rejected."""
+
+    import base64
+    from uuid import uuid4
+
+    from app.api.admin_request import _CREATED_CURSOR
+    from app.api.admin_request import _CREATED_CURSOR_VERSION
+    from app.api.admin_request import _parse_created_cursor
+    from app.exceptions import ValidationError
+
+    raw = _CREATED_CURSOR.pack(2**62, _CREATED_CURSOR_VERSION, uuid4().bytes)
+    cursor = base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+    with pytest.raises(ValidationError):
+        _parse_created_cursor(cursor)
+
+
+def test_managed_organization_ids_are_looked_up_per_request(monkeypatch) -> None:
+    """Ensure managed org lookups are never served from a warm container."""
+
+    from app.api import admin_auth
+
+    calls: list[str] = []
+
+    class FakeSession:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def __enter__(self) -> "FakeSession":
+            return self
+
+        def __exit__(self, *args) -> None:
+            return None
+
+    class FakeRepo:
+        def __init__(self, session) -> None:
+            pass
+
+        def find_ids_by_manager(self, manager_id: str) -> list:
+            calls.append(manager_id)
+            return ["org-1"]
+
+    monkeypatch.setattr(admin_auth, "Session", FakeSession)
+    monkeypatch.setattr(admin_auth, "get_engine", lambda: None)
+    monkeypatch.setattr(admin_auth, "OrganizationRepository", FakeRepo)
+
+    event = {
+        "requestContext": {"authorizer": {"claims": {"sub": "manager-sub"}}},
+    }
+    assert admin_auth._get_managed_organization_ids(event) == {"org-1"}
+    assert admin_auth._get_managed_organization_ids(event) == {"org-1"}
+    assert calls == ["manager-sub", "manager-sub"]
@@ -0,0 +1,106 @@
+"""Tests for admin Cognito user listing."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "backend" / "src"))
+
+from app.api import admin_cognito  # noqa: E402
+
+
+def _user(username: str, sub: str) -> dict:
+    return {
+        "Username": username,
+        "Attributes": [
+            {"Name": "sub", "Value": sub},
+            {"Name": "custom:last_auth_time", "Value": "1700000000"},
+        ],
+    }
+
+
+def test_list_cognito_users_loads_groups_per_group_not_per_user(
+    monkeypatch,
+) -> None:
+    """Ensure memberships are fetched per configured group and cached."""
+
+    monkeypatch.setenv("COGNITO_USER_POOL_ID", "pool-1")
+    monkeypatch.setattr(admin_cognito, "_GROUP_MEMBERSHIPS", {})
+    calls: list[tuple[str, dict]] = []
+
+    def fake_proxy(service: str, action: str, params: dict) -> dict:
+        calls.append((action, params))
+        if action == "list_users":
+            return {"Users": [_user("alice", "sub-a"), _user("bob", "sub-b")]}
+        if action == "list_users_in_group" and params["GroupName"] == "admin":
+            return {"Users": [{"Username": "alice"}]}
+        if action == "list_users_in_group" and "NextToken" not in params:
+            return {"Users": [{"Username": "alice"}], "NextToken": "page-2"}
+        if action == "list_users_in_group":
+            return {"Users": [{"Username": "bob"}]}
+        raise AssertionError(f"unexpected action {action}")
+
+    event = {"queryStringParameters": {"limit": "10"}}
+    with patch.object(admin_cognito, "aws_proxy", side_effect=fake_proxy):
+        response = admin_cognito._handle_list_cognito_users(event)
+
+    body = json.loads(response["body"])
+    groups = {item["username"]: item["groups"] for item in body["items"]}
+    assert groups == {"alice": ["admin", "manager"], "bob": ["manager"]}
+    actions = [action for action, _ in calls]
+    assert "admin_list_groups_for_user" not in actions
+    assert "list_groups" not in actions
+    assert actions.count("list_users_in_group") == 3
+
+    with patch.object(admin_cognito, "aws_proxy", side_effect=fake_proxy):
+        admin_cognito._handle_list_cognito_users(event)
+        admin_cognito._forget_group_memberships()
+        admin_cognito._handle_list_cognito_users(event)
+
+    actions = [action for action, _ in calls]
+    assert actions.count("list_users_in_group") == 6
+
+
+def test_manager_group_assignment_caches_username_not_membership(
+    monkeypatch,
+) -> None:
+    """Ensure repeat approvals reuse the sub lookup but always re-add."""
+
+    monkeypatch.setenv("COGNITO_USER_POOL_ID", "pool-1")
+    monkeypatch.setattr(admin_cognito, "_SUB_TO_USERNAME", {})
+    monkeypatch.setattr(
+        admin_cognito, "_GROUP_MEMBERSHIPS", {"pool-1": (0.0, {"alice": []})}
+    )
+    user_sub = "0f8fad5b-d9cb-469f-a165-70867728950e"
+    calls: list[str] = []
+    groups: list[dict] = []
+
+    def fake_proxy(service: str, action: str, params: dict) -> dict:
+        calls.append(action)
+        if action == "list_users":
+            return {"Users": [_user("alice", user_sub)]}
+        if action == "admin_list_groups_for_user":
+            return {"Groups": list(groups)}
+        if action == "admin_add_user_to_group":
+            groups.append({"GroupName": params["GroupName"]})
+        return {}
+
+    with patch.object(admin_cognito, "aws_proxy", side_effect=fake_proxy):
+        admin_cognito._add_user_to_manager_group(user_sub)
+        admin_cognito._add_user_to_manager_group(user_sub)
+
+    assert calls == [
+        "list_users",
+        "admin_list_groups_for_user",
+        "admin_add_user_to_group",
+        "admin_user_global_sign_out",
+        "admin_list_groups_for_user",
+        "admin_add_user_to_group",
+    ]
+    assert admin_cognito._GROUP_MEMBERSHIPS == {}
+
+    admin_cognito._forget_cognito_user("alice")
+    assert admin_cognito._SUB_TO_USERNAME == {}
@@ -0,0 +1,94 @@
+"""Tests for organization media deletion."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'backend' / 'src'))
+
+from app.api import admin_media  # noqa: E402
+from app.exceptions import ValidationError  # noqa: E402
+
+ORG_ID = UUID('11111111-1111-1111-1111-111111111111')
+BASE_URL = 'https://media.example.com'
+
+
+class _FakeS3:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict]] = []
+
+    def delete_object(self, **kwargs):
+        self.calls.append(('delete_object', kwargs))
+        return {}
+
+    def delete_objects(self, **kwargs):
+        self.calls.append(('delete_objects', kwargs))
+        return {}
+
+
+@pytest.fixture
+def s3(monkeypatch) -> _FakeS3:
+    monkeypatch.setenv('ORGANIZATION_MEDIA_BUCKET', 'media-bucket')
+    monkeypatch.setenv('ORGANIZATION_MEDIA_BASE_URL', BASE_URL)
+    admin_media._media_base_url.cache_clear()
+    client = _FakeS3()
+    monkeypatch.setattr(admin_media, 'get_s3_client', lambda: client)
+    yield client
+    admin_media._media_base_url.cache_clear()
+
+
+def _event(body: dict) -> dict:
+    return {'body': json.dumps(body), 'headers': {}}
+
+
+class TestMediaDelete:
+    """Tests for _handle_media_delete."""
+
+    def test_single_media_url_uses_delete_object(self, s3) -> None:
+        """Ensure a single URL keeps the plain DeleteObject call."""
+        url = f'{BASE_URL}/organizations/{ORG_ID}/a.png'
+
+        response = admin_media._handle_media_delete(_event({'media_url': url}), ORG_ID)
+
+        assert response['statusCode'] == 204
+        assert s3.calls == [
+            (
+                'delete_object',
+                {'Bucket': 'media-bucket', 'Key': f'organizations/{ORG_ID}/a.png'},
+            )
+        ]
+
+    def test_media_urls_are_deleted_in_one_batch(self, s3) -> None:
+        """Ensure several URLs share one deduplicated DeleteObjects call."""
+        urls = [
+            f'{BASE_URL}/organizations/{ORG_ID}/a.png',
+            f'{BASE_URL}/organizations/{ORG_ID}/b.png',
+            f'{BASE_URL}/organizations/{ORG_ID}/a.png',
+        ]
+
+        response = admin_media._handle_media_delete(_event({'media_urls': urls}), ORG_ID)
+
+        assert response['statusCode'] == 204
+        assert len(s3.calls) == 1
+        method, kwargs = s3.calls[0]
+        assert method == 'delete_objects'
+        assert kwargs['Delete']['Objects'] == [
+            {'Key': f'organizations/{ORG_ID}/a.png'},
+            {'Key': f'organizations/{ORG_ID}/b.png'},
+        ]
+
+    def test_media_urls_from_other_organization_rejected(self, s3) -> None:
+        """Ensure no object is deleted when any URL is foreign."""
+        urls = [
+            f'{BASE_URL}/organizations/{ORG_ID}/a.png',
+            f'{BASE_URL}/organizations/other/b.png',
+        ]
+
+        with pytest.raises(ValidationError):
+            admin_media._handle_media_delete(_event({'media_urls': urls}), ORG_ID)
+        assert s3.calls == []
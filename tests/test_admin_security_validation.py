@@ -325,3 +325,48 @@ class TestLikePatternEscape:
 
         result = _escape_like_pattern("test%' OR '1'='1")
         assert result == "test\\%' OR '1'='1"
+
+
+class TestExtractMediaKey:
+    """Tests for extracting object keys from media URLs."""
+
+    BASE_URL = "https://media.example.com"
+
+    @pytest.fixture(autouse=True)
+    def _clear_env_caches(self):
+        from app.api.admin_media import _media_base_url
+        from app.api.admin_request import _require_env
+
+        _media_base_url.cache_clear()
+        _require_env.cache_clear()
+        yield
+        _media_base_url.cache_clear()
+        _require_env.cache_clear()
+
+    def test_key_under_base_url(self, monkeypatch) -> None:
+        """URLs under the media base URL should yield their object key."""
+        from app.api.admin_media import _extract_media_key
+
+        monkeypatch.setenv("ORGANIZATION_MEDIA_BASE_URL", f"{self.BASE_URL}/")
+        result = _extract_media_key(f"{self.BASE_URL}/organizations/1/a.png?v=2")
+        assert result == "organizations/1/a.png"
+
+    def test_foreign_host_rejected(self, monkeypatch) -> None:
+        """URLs on another host, including prefix look-alikes, are rejected."""
+        from app.api.admin_media import _extract_media_key
+
+        monkeypatch.setenv("ORGANIZATION_MEDIA_BASE_URL", self.BASE_URL)
+        for url in (
+            "https://evil.example.com/organizations/1/a.png",
+            "https://media.example.com.evil.io/organizations/1/a.png",
+        ):
+            with pytest.raises(ValidationError):
+                _extract_media_key(url)
+
+    def test_missing_key_rejected(self, monkeypatch) -> None:
+        """A bare base URL should be rejected."""
+        from app.api.admin_media import _extract_media_key
+
+        monkeypatch.setenv("ORGANIZATION_MEDIA_BASE_URL", self.BASE_URL)
+        with pytest.raises(ValidationError):
+            _extract_media_key(f"{self.BASE_URL}/")
@@ -0,0 +1,60 @@
+"""Tests for ticket decision email batching."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'backend' / 'src'))
+
+from app.api import admin_ticket_notifications  # noqa: E402
+from app.db.models import TicketType  # noqa: E402
+
+
+def _ticket(ticket_id: str, ticket_type: TicketType, email: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        ticket_id=ticket_id,
+        ticket_type=ticket_type,
+        submitter_email=email,
+        organization_name='Org',
+        reviewed_at=None,
+    )
+
+
+def test_decision_emails_share_bulk_send_per_template(monkeypatch) -> None:
+    """Ensure templated decisions are grouped and the rest sent singly."""
+
+    monkeypatch.setenv('SES_SENDER_EMAIL', 'noreply@example.com')
+    monkeypatch.setenv('SES_TEMPLATE_SUGGESTION_DECISION', 'SuggestionDecision')
+    monkeypatch.delenv('SES_TEMPLATE_FEEDBACK_DECISION', raising=False)
+
+    bulk_calls: list[dict] = []
+    single_calls: list[dict] = []
+    monkeypatch.setattr(
+        admin_ticket_notifications,
+        'send_bulk_templated_email',
+        lambda **kwargs: bulk_calls.append(kwargs),
+    )
+    monkeypatch.setattr(
+        admin_ticket_notifications,
+        'send_email',
+        lambda **kwargs: single_calls.append(kwargs),
+    )
+
+    admin_ticket_notifications._send_ticket_decision_emails(
+        [
+            (_ticket('S00001', TicketType.ORGANIZATION_SUGGESTION, 'a@x.io'), 'approve', ''),
+            (_ticket('S00002', TicketType.ORGANIZATION_SUGGESTION, 'b@x.io'), 'reject', 'No'),
+            (_ticket('F00001', TicketType.ORGANIZATION_FEEDBACK, 'c@x.io'), 'approve', ''),
+            (_ticket('S00003', TicketType.ORGANIZATION_SUGGESTION, 'unknown'), 'approve', ''),
+        ]
+    )
+
+    assert len(bulk_calls) == 1
+    assert bulk_calls[0]['template_name'] == 'SuggestionDecision'
+    destinations = bulk_calls[0]['destinations']
+    assert [address for address, _ in destinations] == ['a@x.io', 'b@x.io']
+    assert destinations[1][1]['status_text'] == 'DECLINED'
+    assert destinations[1][1]['admin_message'] == 'No'
+    assert [call['to_addresses'] for call in single_calls] == [['c@x.io']]
@@ -0,0 +1,35 @@
+"""Tests for admin ticket review helpers."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "backend" / "src"))
+
+from app.api import admin_tickets  # noqa: E402
+
+
+def test_run_parallel_runs_all_tasks_and_swallows_failures() -> None:
+    """Ensure one failing side effect does not stop or break the others."""
+
+    ran: list[str] = []
+
+    def failing() -> None:
+        ran.append("failing")
+        raise RuntimeError("boom")
+
+    admin_tickets._run_parallel(
+        [lambda: ran.append("first"), failing, lambda: ran.append("last")]
+    )
+
+    assert sorted(ran) == ["failing", "first", "last"]
+
+
+def test_run_parallel_swallows_single_task_failure() -> None:
+    """Ensure a lone failing side effect is logged rather than raised."""
+
+    def failing() -> None:
+        raise RuntimeError("boom")
+
+    admin_tickets._run_parallel([failing])
@@ -16,11 +16,16 @@ from app.api.admin import (  # noqa: E402
     _validate_coordinates,
     _validate_email,
     _validate_manager_id,
+    _validate_media_urls,
     _validate_phone_fields,
     _validate_pricing_amount,
     _validate_social_value,
     _validate_sessions_count,
 )
+from app.api.admin_request import _parse_uuid  # noqa: E402
+from app.api.admin_validators import _parse_languages  # noqa: E402
+from app.api.admin_resource_pricing import _parse_pricing_type  # noqa: E402
+from app.db.models import PricingType  # noqa: E402
 from app.exceptions import ValidationError  # noqa: E402
 
 
@@ -186,6 +191,18 @@ class TestValidatePricingAmount:
         _validate_pricing_amount("0")
         _validate_pricing_amount(0.00)
 
+    def test_returns_decimal(self) -> None:
+        """Validated amounts should come back as exact Decimals."""
+        assert _validate_pricing_amount(150.5) == Decimal("150.5")
+        assert _validate_pricing_amount(100) == Decimal("100")
+        assert _validate_pricing_amount("99.99") == Decimal("99.99")
+
+    def test_boolean_amount_rejected(self) -> None:
+        """Booleans should not be accepted as amounts."""
+        with pytest.raises(ValidationError) as exc_info:
+            _validate_pricing_amount(True)
+        assert "amount must be a valid number" in str(exc_info.value)
+
 
 class TestValidateSessionsCount:
     """Tests for sessions count validation."""
@@ -222,6 +239,75 @@ class TestValidateSessionsCount:
         """Float that converts to valid integer should work."""
         _validate_sessions_count(5.0)  # int(5.0) = 5
 
+    def test_returns_integer(self) -> None:
+        """Validated counts should be normalized to int."""
+        assert _validate_sessions_count("10") == 10
+        assert _validate_sessions_count(5.0) == 5
+
+
+class TestParsePricingType:
+    """Tests for pricing type parsing."""
+
+    def test_valid_pricing_type(self) -> None:
+        """Known values should resolve to enum members."""
+        assert _parse_pricing_type("per_class") is PricingType.PER_CLASS
+        assert _parse_pricing_type(PricingType.FREE) is PricingType.FREE
+
+    @pytest.mark.parametrize("value", ["monthly", "", None, ["free"]])
+    def test_invalid_pricing_type(self, value: object) -> None:
+        """Unknown values should raise ValidationError, not ValueError."""
+        with pytest.raises(ValidationError) as exc_info:
+            _parse_pricing_type(value)
+        assert exc_info.value.field == "pricing_type"
+
+
+class TestParseUuid:
+    """Tests for UUID parsing of ids from request bodies."""
+
+    def test_uuid_instance_returned_unchanged(self) -> None:
+        """UUID instances should pass through without re-parsing."""
+        value = uuid4()
+        assert _parse_uuid(value) is value
+
+    def test_string_parsed(self) -> None:
+        """Canonical strings should parse to the same UUID."""
+        value = uuid4()
+        assert _parse_uuid(str(value)) == value
+
+    def test_invalid_value_rejected(self) -> None:
+        """Non-UUID strings should raise a validation error."""
+        with pytest.raises(ValidationError):
+            _parse_uuid("not-a-uuid")
+
+
+class TestValidateMediaUrls:
+    """Tests for media URL list validation."""
+
+    def test_duplicates_removed_and_sorted(self) -> None:
+        """Repeated URLs should be stored once, in sorted order."""
+        urls = [
+            "https://cdn.example.com/b.png",
+            " https://cdn.example.com/a.png ",
+            "https://cdn.example.com/b.png",
+            "",
+        ]
+        assert _validate_media_urls(urls) == [
+            "https://cdn.example.com/a.png",
+            "https://cdn.example.com/b.png",
+        ]
+
+
+class TestParseLanguages:
+    """Tests for languages parsing."""
+
+    def test_empty_list_items_do_not_count_toward_limit(self) -> None:
+        """Blank list items should be dropped before the item limit applies."""
+        assert _parse_languages(["en"] + [""] * 20) == ["en"]
+
+    def test_empty_string_segments_do_not_count_toward_limit(self) -> None:
+        """Blank comma-separated segments should be dropped as well."""
+        assert _parse_languages("en" + "," * 20) == ["en"]
+
 
 class TestValidateManagerId:
     """Tests for organization manager_id (Cognito user sub) validation."""
@@ -0,0 +1,93 @@
+"""Tests for the manager request processor's SQS batch handling."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1] / "backend"
+sys.path.append(str(BACKEND_DIR / "src"))
+
+_spec = importlib.util.spec_from_file_location(
+    "manager_request_processor_handler",
+    BACKEND_DIR / "lambda" / "manager_request_processor" / "handler.py",
+)
+processor = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(processor)
+
+
+def _record(message_id: str, message: dict | str) -> dict:
+    body = message if isinstance(message, str) else json.dumps(message)
+    return {"messageId": message_id, "body": json.dumps({"Message": body})}
+
+
+@pytest.fixture
+def submissions(monkeypatch) -> list[str]:
+    stored: list[str] = []
+
+    def fake_store(message: dict, ticket_type) -> object:
+        stored.append(message["ticket_id"])
+        return object()
+
+    monkeypatch.setattr(processor, "_store_ticket", fake_store)
+    monkeypatch.setattr(processor, "_send_notification_email", lambda ticket: None)
+    return stored
+
+
+def test_poison_record_is_the_only_batch_item_failure(submissions, monkeypatch) -> None:
+    """Ensure a bad record does not fail the healthy records in its batch."""
+
+    monkeypatch.setattr(
+        processor, "_send_decision_notifications", lambda messages: len(messages)
+    )
+    event = {
+        "Records": [
+            _record("bad", "not json"),
+            _record(
+                "submission",
+                {"event_type": "manager_request.submitted", "ticket_id": "R00001"},
+            ),
+            _record(
+                "decision",
+                {"event_type": "ticket.decided", "ticket_id": "R00002"},
+            ),
+        ]
+    }
+
+    result = processor.lambda_handler(event, None)
+
+    assert result["batchItemFailures"] == [{"itemIdentifier": "bad"}]
+    assert submissions == ["R00001"]
+    assert json.loads(result["body"]) == {"processed": 2, "skipped": 0, "failed": 1}
+
+
+def test_decision_send_failure_reports_only_decision_records(
+    submissions, monkeypatch
+) -> None:
+    """Ensure a failed decision send retries only the decision messages."""
+
+    def failing(messages: list) -> int:
+        raise RuntimeError("ses down")
+
+    monkeypatch.setattr(processor, "_send_decision_notifications", failing)
+    event = {
+        "Records": [
+            _record(
+                "submission",
+                {"event_type": "manager_request.submitted", "ticket_id": "R00001"},
+            ),
+            _record(
+                "decision",
+                {"event_type": "ticket.decided", "ticket_id": "R00002"},
+            ),
+        ]
+    }
+
+    result = processor.lambda_handler(event, None)
+
+    assert result["batchItemFailures"] == [{"itemIdentifier": "decision"}]
+    assert submissions == ["R00001"]
@@ -142,6 +142,32 @@ class TestOrganizationRepository:
 
         assert repo.get_by_id(org_id) is None
 
+    def test_transfer_manager(self, db_session) -> None:
+        """Should reassign all organizations of a manager in one update."""
+        from app.db.repositories.organization import OrganizationRepository
+
+        new_manager_id = '00000000-0000-0000-0000-000000000002'
+        repo = OrganizationRepository(db_session)
+        repo.create_organization(name='Transfer A', manager_id=TEST_MANAGER_ID)
+        repo.create_organization(name='Transfer B', manager_id=TEST_MANAGER_ID)
+
+        transferred = repo.transfer_manager(TEST_MANAGER_ID, new_manager_id)
+        db_session.expire_all()
+
+        assert transferred == 2
+        assert repo.find_by_manager(TEST_MANAGER_ID) == []
+        assert len(repo.find_by_manager(new_manager_id)) == 2
+
+    def test_find_ids_by_manager(self, db_session) -> None:
+        """Should return only the ids of the manager's organizations."""
+        from app.db.repositories.organization import OrganizationRepository
+
+        repo = OrganizationRepository(db_session)
+        first = repo.create_organization(name='Ids A', manager_id=TEST_MANAGER_ID)
+        second = repo.create_organization(name='Ids B', manager_id=TEST_MANAGER_ID)
+
+        assert set(repo.find_ids_by_manager(TEST_MANAGER_ID)) == {first.id, second.id}
+
 
 class TestLocationRepository:
     """Tests for LocationRepository class."""
@@ -48,3 +48,10 @@ def test_parse_cursor_rejects_invalid_value() -> None:
     cursor = base64.urlsafe_b64encode(raw).decode("utf-8").rstrip("=")
     with pytest.raises(CursorError):
         _parse_cursor(cursor)
+
+
+def test_parse_cursor_rejects_oversized_value() -> None:
+    """Ensure oversized cursors are rejected before decoding."""
+
+    with pytest.raises(CursorError):
+        _parse_cursor("A" * 4096)